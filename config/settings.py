@@ -2,6 +2,7 @@
 统一配置管理
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 import json
@@ -34,6 +35,8 @@ class Settings:
     """应用配置类"""
 
     def __init__(self):
+        # 上次加载的用户配置文件修改时间，未变化时跳过重新解析
+        self._user_cfg_mtime = None
         self.load_from_env()
         self.load_user_config()
 
@@ -42,9 +45,20 @@ class Settings:
         # DeepSeek API配置
         self.DEEPSEEK_API_KEY = os.getenv('DEEPSEEK_API_KEY', '')
         self.DEEPSEEK_BASE_URL = os.getenv('DEEPSEEK_BASE_URL', 'https://api.deepseek.com/v1')
+        self.DEEPSEEK_MODEL = os.getenv('DEEPSEEK_MODEL', 'deepseek-chat')
+        # 单次请求中打包生成摘要的论文数量
+        self.SUMMARY_BATCH_SIZE = int(os.getenv('SUMMARY_BATCH_SIZE', '8'))
+        # 同时进行的DeepSeek请求上限
+        self.DEEPSEEK_MAX_CONCURRENCY = int(os.getenv('DEEPSEEK_MAX_CONCURRENCY', '8'))
+        # 每分钟最多发送的DeepSeek请求数，0表示不限制
+        self.DEEPSEEK_RPM = int(os.getenv('DEEPSEEK_RPM', '60'))
+        # 每分钟最多消耗的DeepSeek token数（输入估算+输出上限），0表示不限制
+        self.DEEPSEEK_TPM = int(os.getenv('DEEPSEEK_TPM', '0'))
 
         # 数据库配置
         self.DATABASE_URL = os.getenv('DATABASE_URL', f'sqlite:///{DATABASE_DIR}/arxiv_papers.db')
+        # 解析一次数据库绝对路径，相对路径基于项目根目录
+        self._db_path = str((PROJECT_ROOT / self.DATABASE_URL.replace('sqlite:///', '')).resolve())
 
         # 爬取配置
         self.MAX_PAPERS_PER_DAY = int(os.getenv('MAX_PAPERS_PER_DAY', '10'))
@@ -54,6 +68,22 @@ class Settings:
         except:
             self.SEARCH_KEYWORDS = ["materials science", "machine learning"]
 
+        # API结果缺少published字段时，是否从arXiv详情页获取精确到日的提交日期；设为false时按ID中的年月记录，省去请求
+        self.ARXIV_REQUIRE_DAY_PRECISION = os.getenv('ARXIV_REQUIRE_DAY_PRECISION', 'true').lower() == 'true'
+
+        # 相邻两次arXiv API请求的最小间隔（秒），arXiv要求不超过每3秒一次，0表示不限制
+        self.ARXIV_API_MIN_INTERVAL = float(os.getenv('ARXIV_API_MIN_INTERVAL', '3'))
+
+        # 并发获取arXiv详情页的最大线程数
+        self.ARXIV_PAGE_FETCH_WORKERS = int(os.getenv('ARXIV_PAGE_FETCH_WORKERS', '8'))
+
+        # 热门主题统计时额外过滤的领域常见词（JSON数组）
+        trending_stopwords = os.getenv('TRENDING_STOPWORDS', '[]')
+        try:
+            self.TRENDING_STOPWORDS = json.loads(trending_stopwords)
+        except:
+            self.TRENDING_STOPWORDS = []
+
         # 日志配置
         self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
         self.LOG_FILE = os.getenv('LOG_FILE', 'arxiv_scraper.log')
@@ -62,15 +92,20 @@ class Settings:
         self.SCHEDULE_TIME = os.getenv('SCHEDULE_TIME', '09:00')
 
     def load_user_config(self):
-        """加载用户配置文件"""
-        if USER_CONFIG_FILE.exists():
-            try:
-                with open(USER_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    user_config = json.load(f)
-                    for key, value in user_config.items():
-                        setattr(self, key, value)
-            except Exception as e:
-                print(f"加载用户配置失败: {e}")
+        """加载用户配置文件（文件未修改时直接返回）"""
+        try:
+            mtime = os.stat(USER_CONFIG_FILE).st_mtime
+            if mtime == self._user_cfg_mtime:
+                return
+            with open(USER_CONFIG_FILE, 'r', encoding='utf-8') as f:
+                user_config = json.load(f)
+                for key, value in user_config.items():
+                    setattr(self, key, value)
+            self._user_cfg_mtime = mtime
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"加载用户配置失败: {e}")
 
     @property
     def log_file_path(self) -> Path:
@@ -84,8 +119,13 @@ class Settings:
 
     @property
     def database_path(self) -> str:
-        """获取数据库路径"""
-        return str(DATABASE_DIR / "arxiv_papers.db")
+        """获取数据库绝对路径"""
+        return self._db_path
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """获取全局唯一的配置实例"""
+    return Settings()
 
 # 全局配置实例
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -3,14 +3,8 @@
 AutoMatResearch 主启动脚本
 """
 
-import sys
-import os
-from pathlib import Path
-
-# 确保项目根目录在Python路径中
-PROJECT_ROOT = Path(__file__).parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
+# 直接运行本脚本时，脚本所在的项目根目录已在sys.path中；
+# 安装后也可使用 automainresearch / automainresearch-cli 命令
 if __name__ == "__main__":
     from src.main import main
     main()
\ No newline at end of file
@@ -16,10 +16,15 @@ def check_python_version():
     print(f"✅ Python版本: {sys.version}")
 
 def install_dependencies():
-    """安装依赖包"""
+    """安装依赖包，优先使用uv，未安装时回退到pip"""
     print("📦 安装依赖包...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        try:
+            subprocess.check_call(["uv", "pip", "install", "--python", sys.executable, "-r", "requirements.txt"])
+        except FileNotFoundError:
+            print("💡 未找到uv，使用pip安装")
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "--disable-pip-version-check",
+                                   "-r", "requirements.txt"])
         print("✅ 依赖包安装完成")
     except subprocess.CalledProcessError as e:
         print(f"❌ 依赖包安装失败: {e}")
@@ -28,8 +33,12 @@ def install_dependencies():
 def setup_directories():
     """创建必要的目录"""
     directories = ["logs", "insights", "reports", "trends", "exports"]
+    # 一次扫描当前目录，只创建缺失的目录
+    with os.scandir('.') as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+        if directory not in existing:
+            os.makedirs(directory, exist_ok=True)
     print("✅ 目录结构创建完成")
 
 def setup_env_file():
@@ -4,26 +4,20 @@
 提供交互式的关键词管理和系统控制
 """
 
-import cmd
+import functools
 import sys
-import os
-from pathlib import Path
-from typing import List
-
-# 添加项目根目录到Python路径
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+from typing import Callable, Dict, List
 
 from src.utils.logger import get_logger, setup_logger
 from src.core.scheduler import PaperScheduler
 from src.core.scraper import ArxivScraper
 from src.core.analyzer import DeepSeekAnalyzer
 from src.utils.utils import ConfigManager, PaperExporter, format_paper_summary
-from src.utils.config import settings
+from config.settings import settings
 
 logger = get_logger(__name__)
 
-class ArxivCLI(cmd.Cmd):
+class ArxivCLI:
     """arXiv爬虫命令行界面"""
 
     intro = """
@@ -37,12 +31,92 @@ class ArxivCLI(cmd.Cmd):
     prompt = "arXiv> "
 
     def __init__(self):
-        super().__init__()
-        self.scheduler = PaperScheduler()
-        self.scraper = ArxivScraper()
-        self.analyzer = DeepSeekAnalyzer()
         self.config_manager = ConfigManager()
-        self.exporter = PaperExporter(self.scraper.db)
+        # 命令名到处理函数的映射，只构建一次
+        self._cmds: Dict[str, Callable[[str], object]] = {
+            "status": self.do_status,
+            "keywords": self.do_keywords,
+            "scrape": self.do_scrape,
+            "search": self.do_search,
+            "recent": self.do_recent,
+            "insights": self.do_insights,
+            "trending": self.do_trending,
+            "compare": self.do_compare,
+            "export": self.do_export,
+            "start_scheduler": self.do_start_scheduler,
+            "help": self.do_help,
+            "?": self.do_help,
+            "quit": self.do_quit,
+        }
+
+    def cmdloop(self):
+        """交互式命令循环"""
+        try:
+            import readline
+            commands = sorted(self._cmds)
+            readline.set_completer(
+                lambda text, state: ([c for c in commands if c.startswith(text)] + [None])[state]
+            )
+            readline.parse_and_bind("tab: complete")
+        except ImportError:
+            pass
+
+        print(self.intro)
+        while True:
+            try:
+                line = input(self.prompt)
+            except EOFError:
+                print()
+                break
+            if self.onecmd(line):
+                break
+
+    def onecmd(self, line: str) -> bool:
+        """
+        解析并执行一行命令
+
+        Args:
+            line: 用户输入的命令行
+
+        Returns:
+            是否退出命令循环
+        """
+        line = line.strip()
+        if not line:
+            return False
+        # 与cmd.Cmd一致："?命令" 等同于 "help 命令"
+        if line.startswith('?'):
+            line = 'help ' + line[1:]
+
+        # 只切出命令名，其余参数原样交给处理函数
+        name, _, arg = line.partition(' ')
+
+        handler = self._cmds.get(name)
+        if handler is None:
+            return self._unknown(name)
+        return bool(handler(arg.strip()))
+
+    def _unknown(self, name: str) -> bool:
+        """处理未知命令"""
+        print(f"❌ 未知命令: {name}，输入 'help' 查看可用命令")
+        return False
+
+    # 以下组件在首次使用时才创建，使控制台能立即启动
+    @functools.cached_property
+    def scheduler(self) -> PaperScheduler:
+        return PaperScheduler()
+
+    @functools.cached_property
+    def scraper(self) -> ArxivScraper:
+        return ArxivScraper()
+
+    @functools.cached_property
+    def analyzer(self) -> DeepSeekAnalyzer:
+        return DeepSeekAnalyzer()
+
+    @functools.cached_property
+    def exporter(self) -> PaperExporter:
+        return PaperExporter(self.scraper.db)
 
     def do_status(self, arg):
         """查看系统状态"""
@@ -171,10 +245,15 @@ class ArxivCLI(cmd.Cmd):
 
         print(f"🧠 正在分析最近{days}天的研究趋势...")
         try:
-            insights = self.analyzer.get_research_insights(days)
             print("\n📊 研究洞察:")
             print("=" * 60)
-            print(insights)
+            streamed = []
+            insights = self.analyzer.get_research_insights(days, on_delta=self._stream_printer(streamed))
+            if streamed:
+                print()
+            else:
+                # 命中缓存时没有流式输出，直接打印完整结果
+                print(insights)
         except Exception as e:
             print(f"❌ 生成洞察失败: {e}")
 
@@ -220,7 +299,7 @@ class ArxivCLI(cmd.Cmd):
 
         print(f"🔥 正在分析最近{days}天的热门主题...")
         try:
-            topics = self.scraper.get_trending_topics(days)
+            topics = self.analyzer.get_trending_topics(days)
             if topics:
                 print(f"\n📈 热门主题 (最近{days}天):")
                 print("=" * 40)
@@ -244,13 +323,25 @@ class ArxivCLI(cmd.Cmd):
 
         print(f"🔍 正在比较论文: {', '.join(paper_ids)}")
         try:
-            comparison = self.analyzer.compare_papers(paper_ids)
             print("\n📊 论文比较分析:")
             print("=" * 60)
-            print(comparison)
+            streamed = []
+            comparison = self.analyzer.compare_papers(paper_ids, on_delta=self._stream_printer(streamed))
+            if streamed:
+                print()
+            else:
+                print(comparison)
         except Exception as e:
             print(f"❌ 比较分析失败: {e}")
 
+    @staticmethod
+    def _stream_printer(streamed: List[str]) -> Callable[[str], None]:
+        """创建流式输出回调：逐段打印并记录已输出内容"""
+        def on_delta(delta: str):
+            streamed.append(delta)
+            print(delta, end='', flush=True)
+        return on_delta
+
     def do_start_scheduler(self, arg):
         """启动定时调度器"""
         print("⏰ 启动定时调度器...")
@@ -289,7 +380,11 @@ class ArxivCLI(cmd.Cmd):
             print("  export json 30")
             print("=" * 50)
         else:
-            super().do_help(arg)
+            handler = self._cmds.get(arg)
+            if handler is None:
+                self._unknown(arg)
+            else:
+                print(handler.__doc__)
 
     def do_quit(self, arg):
         """退出程序"""
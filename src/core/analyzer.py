@@ -1,44 +1,390 @@
 import openai
-import os
-from typing import List, Optional
+import atexit
+import functools
+import hashlib
+import itertools
+import json
+import queue
+import random
+import string
+import threading
+import time
+import httpx
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 from src.data.database import Paper, DatabaseManager
 from config.settings import settings
-from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# 进程内共享的HTTP连接池，所有分析器实例复用同一组keep-alive连接
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """获取共享的HTTP客户端（首次调用时创建，安装了h2时启用HTTP/2）"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                try:
+                    import h2  # noqa: F401
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                # 自定义transport时连接池参数需设置在transport上；retries只重试建立连接失败
+                transport = httpx.HTTPTransport(
+                    http2=http2,
+                    retries=2,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+                )
+                _http_client = httpx.Client(
+                    transport=transport,
+                    timeout=httpx.Timeout(60.0, connect=5.0)
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
+def _warm_up_connection():
+    """预先与API服务器建立连接（TCP/TLS握手），连接随后留在连接池中供正式请求复用"""
+    try:
+        _get_http_client().head(settings.DEEPSEEK_BASE_URL, timeout=5.0)
+    except Exception as e:
+        logger.debug(f"预热API连接失败: {e}")
+
+# 可重试的API错误：限流、连接失败/超时（APITimeoutError是APIConnectionError的子类）、服务端5xx
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    计算重试等待时间：优先使用服务端返回的Retry-After，否则为带随机抖动的指数退避
+
+    Args:
+        error: 本次请求的异常
+        attempt: 已尝试次数（从1开始）
+
+    Returns:
+        等待秒数
+    """
+    response = getattr(error, 'response', None)
+    if response is not None:
+        retry_after = response.headers.get('retry-after')
+        if retry_after:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass
+    return random.uniform(1.0, min(30.0, 2.0 ** attempt))
+
+
+class _TokenBucket:
+    """令牌桶限速器：按每分钟额度匀速补充令牌，额度未用完时请求无需等待，线程安全"""
+
+    # 触发限流后减速的持续时间（秒）
+    THROTTLE_PERIOD = 60.0
+
+    def __init__(self, per_minute: int):
+        self.rate = per_minute / 60.0 if per_minute > 0 else 0.0
+        self.capacity = float(per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._throttled_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0):
+        """
+        取出指定数量的令牌，令牌不足时阻塞到补足为止
+
+        Args:
+            amount: 需要的令牌数，超过桶容量时按容量计
+        """
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            # 最近被限流时按一半速率补充令牌
+            rate = self.rate / 2 if now < self._throttled_until else self.rate
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            # 先预扣令牌再等待，后到的请求排在其后，保证先来先服务
+            self._tokens -= min(amount, self.capacity)
+            wait = -self._tokens / rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def throttle(self):
+        """收到限流(429)响应后调用：清空剩余令牌，并在THROTTLE_PERIOD内减半补充速率"""
+        if not self.rate:
+            return
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._throttled_until = time.monotonic() + self.THROTTLE_PERIOD
+
+
+# 进程内所有分析器共享同一组限速器，保证总请求数和token数不超过DEEPSEEK_RPM/DEEPSEEK_TPM
+_request_bucket = _TokenBucket(settings.DEEPSEEK_RPM)
+_token_bucket = _TokenBucket(settings.DEEPSEEK_TPM)
+
+# 进程内所有分析器共享的并发名额，限制同时进行的API请求（含尚未读完的流式响应）数量
+_api_semaphore = threading.BoundedSemaphore(max(1, settings.DEEPSEEK_MAX_CONCURRENCY))
+
+# 批量生成摘要时每累积这么多篇就写回一次数据库
+_SUMMARY_FLUSH_SIZE = 16
+
+# 研究洞察的进程内短期缓存：(数据库路径, 天数, 时间桶) -> 洞察文本
+# Web端每个请求都会新建分析器，因此放在模块级别共享
+_INSIGHTS_MEMO_TTL = 60
+_INSIGHTS_MEMO_MAX = 32
+_insights_memo: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_insights_memo_lock = threading.Lock()
+
+# 正在生成中的洞察：(数据库路径, 缓存键) -> Future，并发请求共享同一次生成
+_inflight_insights: Dict[Tuple[str, str], Future] = {}
+_inflight_insights_lock = threading.Lock()
+
+# 等待其他线程生成同一洞察的最长时间（秒）
+_INSIGHTS_WAIT_TIMEOUT = 120
+
+# 流式生成洞察时写入进度表的最小间隔（秒）
+_INSIGHTS_PROGRESS_INTERVAL = 1.0
+
+# 研究洞察中每篇论文的标题和摘要的token预算
+_INSIGHTS_TITLE_TOKENS = 30
+_INSIGHTS_SUMMARY_TOKENS = 150
+
+
+def _char_tokens(ch: str) -> float:
+    """估算单个字符的token数：中日韩字符约1个token，其他字符约4个字符1个token"""
+    return 1.0 if ord(ch) >= 0x2E80 else 0.25
+
+
+def _estimate_tokens(text: str) -> int:
+    """按字符类型粗略估算文本的token数"""
+    return int(sum(_char_tokens(ch) for ch in text) + 0.5)
+
+
+def _collapse_whitespace(text: str) -> str:
+    """将换行、缩进等连续空白合并为单个空格"""
+    return " ".join(text.split())
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    按估算的token数截断文本
+
+    Args:
+        text: 原始文本
+        max_tokens: 最大token数
+
+    Returns:
+        截断后的文本
+    """
+    # 每个字符至少0.25个token，不超过该长度的文本无需逐字计算
+    if len(text) * 0.25 <= max_tokens and _estimate_tokens(text) <= max_tokens:
+        return text
+    used = 0.0
+    for i, ch in enumerate(text):
+        used += _char_tokens(ch)
+        if used > max_tokens:
+            return text[:i]
+    return text
+
+# 后台洞察更新队列：由单个工作线程依次执行，避免在请求路径上阻塞等待API
+_insights_jobs: "queue.Queue[Tuple[DeepSeekAnalyzer, int, Future]]" = queue.Queue()
+_insights_worker: Optional[threading.Thread] = None
+_insights_worker_lock = threading.Lock()
+
+
+def _run_insights_worker():
+    """后台洞察更新工作线程：依次处理队列中的更新任务"""
+    while True:
+        analyzer, days, future = _insights_jobs.get()
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(analyzer.auto_update_insights_if_needed(days))
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            _insights_jobs.task_done()
+
+# 热门主题提取：长度不少于4的英文单词（含连字符），标点和数字替换为空格后按空白切分
+# 中文摘要中英文术语常紧挨全角标点（如“（perovskite）”），通用标点、CJK标点和全角字符也一并替换
+_PUNCT_TO_SPACE = str.maketrans({
+    c: ' ' for c in itertools.chain(
+        string.punctuation.replace('-', ''),
+        string.digits,
+        map(chr, range(0x2000, 0x2070)),
+        map(chr, range(0x3000, 0x3040)),
+        map(chr, range(0xFF00, 0xFFF0)),
+    )
+})
+_MIN_TOPIC_WORD_LEN = 4
+
+# 热门主题统计时过滤的常见词汇
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'we', 'our', 'this', 'that', 'these', 'those', 'is', 'are', 'was',
+    'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'can', 'could', 'may', 'might', 'should', 'shall', 'must', 'paper', 'study',
+    'research', 'analysis', 'approach', 'method', 'model', 'system', 'algorithm',
+    'propose', 'present', 'show', 'demonstrate', 'evaluate', 'performance', 'result'
+})
+
+# 通用常见词加上配置的领域常见词
+_STOPWORDS = _COMMON_WORDS | frozenset(word.lower() for word in settings.TRENDING_STOPWORDS)
+
+
+def _count_topic_words(texts: List[str]) -> Counter:
+    """
+    统计一组文本中的主题词频
+
+    Args:
+        texts: 标题加正文的文本列表
+
+    Returns:
+        过滤常见词后的词频统计
+    """
+    # 拼接后统一转小写，用translate和split切词（均在C层完成），保留带连字符的技术术语
+    text = "\n".join(texts).lower()
+    raw_count = Counter(text.translate(_PUNCT_TO_SPACE).split())
+
+    # 只对去重后的词做过滤：去掉首尾连字符、非英文的词（如中文摘要）、过短的词和常见词
+    word_count = Counter()
+    for word, count in raw_count.items():
+        word = word.strip('-')
+        if (len(word) >= _MIN_TOPIC_WORD_LEN and word.isascii() and word.replace('-', '').isalpha()
+                and word not in _STOPWORDS):
+            word_count[word] += count
+    return word_count
+
+# 提示词模板，在模块加载时构建一次
+SUMMARY_TMPL = string.Template("""
+请为以下论文生成一个完整、准确的中文摘要，确保覆盖原文所有关键信息：
+
+标题：$title
+
+作者：$authors
+
+英文摘要：$abstract
+
+分类：$categories
+
+要求：
+1. 必须完整翻译和概括原文所有重要信息，不能遗漏关键内容
+2. 突出研究背景、主要贡献、方法创新、实验结果和结论
+3. 使用专业的学术中文表达，术语准确
+4. 根据原文长度，中文摘要应在300-800字之间
+5. 确保技术细节和方法描述的完整性
+6. 如果原文很长，请适当增加摘要长度以确保信息完整性
+
+请提供完整的中文摘要：
+""")
+
+# 洞察请求中固定不变的分析要求，放在论文数据之前，便于服务端复用前缀缓存
+INSIGHTS_INSTRUCTIONS = """
+你是一个专业的学术分析师。请基于下一条消息中提供的最近研究论文进行分析。
+
+请提供深入的研究洞察分析，使用优美的Markdown格式，包括：
+
+## 🔬 研究趋势分析
+识别当前最主要的研究热点和趋势方向
+
+## ⚡ 技术突破点
+找出重要的技术创新和方法突破
+
+## 🔗 跨学科融合
+识别不同研究领域之间的交叉融合趋势
+
+## 🔮 未来展望
+基于当前研究趋势预测未来发展方向
+
+## 👥 关键研究团队
+识别活跃的研究机构和作者群体
+
+格式要求：
+- 用中文回答，使用优雅的Markdown格式
+- 每个主要部分使用合适的emoji图标
+- 重要概念和关键词使用**加粗**强调
+- 技术术语和方法使用`代码格式`标注
+- 适当使用引用块>突出重点观点
+- 确保内容结构清晰，层次分明
+- 字数控制在800-1200字之间
+- 基于实际论文内容进行分析，不要泛泛而谈
+"""
+
+INSIGHTS_TMPL = string.Template("""
+**数据概况：**
+- 时间范围：最近$days天
+- 总论文数：$total_papers篇
+- 深度分析：$analyzed_count篇（$analyzed_ratio%）
+
+分析论文：
+$payload
+""")
+
+COMPARE_TMPL = string.Template("""
+请比较分析以下几篇论文的异同点：
+
+$payload
+
+请从以下几个方面进行比较：
+1. 研究目标和问题的异同
+2. 方法论的区别
+3. 主要贡献和创新点
+4. 优缺点对比
+5. 适用场景的差异
+
+请用中文回答，结构化输出。
+""")
+
+# 各类请求的系统消息，模块加载时构建一次
+_SUMMARY_SYSTEM = {"role": "system", "content": "你是专业的学术论文翻译和分析师，擅长将英文科技论文准确、完整地翻译成中文，并确保所有技术细节和专业术语的正确性。"}
+_REGENERATE_SYSTEM = {"role": "system", "content": "你是专业的学术论文翻译专家，确保将英文论文内容完整、准确地翻译成中文，不遗漏任何重要信息。"}
+_INSIGHTS_SYSTEM = {"role": "system", "content": "你是一个专业的研究趋势分析师，擅长从学术论文中提取有价值的洞察。"}
+_INSIGHTS_INSTRUCTIONS_MESSAGE = {"role": "user", "content": INSIGHTS_INSTRUCTIONS}
+_COMPARE_SYSTEM = {"role": "system", "content": "你是一个专业的学术比较分析师，擅长深入分析和比较不同研究论文。"}
+
 class DeepSeekAnalyzer:
     def __init__(self, keyword: str = None):
-        self.client = openai.OpenAI(
+        # API客户端和数据库管理器在首次使用时才创建，见client/db属性
+        self.keyword = keyword
+
+        # 待写回数据库的摘要 (summary, arxiv_id)
+        self._pending_updates: List[Tuple[str, str]] = []
+        self._pending_lock = threading.Lock()
+
+    @functools.cached_property
+    def client(self) -> openai.OpenAI:
+        """DeepSeek API客户端（首次访问时创建）"""
+        return openai.OpenAI(
             api_key=settings.DEEPSEEK_API_KEY,
-            base_url=settings.DEEPSEEK_BASE_URL
+            base_url=settings.DEEPSEEK_BASE_URL,
+            http_client=_get_http_client()
         )
-        self.keyword = keyword
+
+    @functools.cached_property
+    def db(self) -> DatabaseManager:
+        """数据库管理器（首次访问时创建）"""
         # 根据关键词获取数据库管理器
-        if keyword:
+        if self.keyword:
             from src.data.keyword_manager import keyword_manager
-            db_manager = keyword_manager.get_database_manager(keyword)
-            self.db = db_manager
+            db = keyword_manager.get_database_manager(self.keyword)
         else:
-            # 使用绝对路径确保数据库连接一致性
-            db_path = settings.DATABASE_URL.replace("sqlite:///", "")
-            if not os.path.isabs(db_path):
-                # 如果是相对路径，转换为基于项目根目录的绝对路径
-                project_root = Path(__file__).parent.parent.parent
-                db_path = project_root / db_path
-            self.db = DatabaseManager(str(db_path))
+            # 使用配置中解析好的绝对路径确保数据库连接一致性
+            db = DatabaseManager(settings.database_path)
         # 确保insights_cache表存在
-        self._init_insights_cache_table()
+        self._init_insights_cache_table(db)
+        return db
 
-        # 添加锁机制防止并发生成洞察
-        self._generating_insights = set()  # 存储正在生成的洞察键
-
-    def _init_insights_cache_table(self):
+    def _init_insights_cache_table(self, db: DatabaseManager):
         """初始化洞察缓存表"""
         try:
-            import sqlite3
-            with sqlite3.connect(self.db.db_path) as conn:
+            with db.conn as conn:
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS insights_cache (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -54,17 +400,25 @@ class DeepSeekAnalyzer:
         except Exception as e:
             logger.error(f"初始化insights_cache表失败: {e}")
 
-    def generate_summary(self, paper: Paper) -> Optional[str]:
+    def generate_summary(self, paper: Paper, on_delta: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """
         使用DeepSeek生成论文摘要 - 改进版本，确保翻译完整性
 
         Args:
             paper: 论文对象
+            on_delta: 流式输出回调，每收到一段文本调用一次
 
         Returns:
             生成的摘要文本
         """
         try:
+            # 相同输入已生成过摘要时直接返回缓存
+            cache_key = self._summary_cache_key(paper)
+            cached = self.db.get_cached_summaries([cache_key]).get(cache_key)
+            if cached:
+                logger.info(f"论文 {paper.arxiv_id} 命中摘要缓存")
+                return cached
+
             # 根据摘要长度动态调整token限制
             abstract_length = len(paper.abstract)
             if abstract_length < 500:
@@ -75,32 +429,18 @@ class DeepSeekAnalyzer:
                 max_tokens = 2000  # 长摘要使用最大token限制
 
             # 改进的提示词，明确要求完整性
-            prompt = f"""
-请为以下论文生成一个完整、准确的中文摘要，确保覆盖原文所有关键信息：
-
-标题：{paper.title}
-
-作者：{', '.join(paper.authors)}
-
-英文摘要：{paper.abstract}
-
-分类：{', '.join(paper.categories)}
-
-要求：
-1. 必须完整翻译和概括原文所有重要信息，不能遗漏关键内容
-2. 突出研究背景、主要贡献、方法创新、实验结果和结论
-3. 使用专业的学术中文表达，术语准确
-4. 根据原文长度，中文摘要应在300-800字之间
-5. 确保技术细节和方法描述的完整性
-6. 如果原文很长，请适当增加摘要长度以确保信息完整性
-
-请提供完整的中文摘要：
-"""
+            prompt = SUMMARY_TMPL.substitute(
+                title=paper.title,
+                authors=", ".join(paper.authors),
+                abstract=paper.abstract,
+                categories=", ".join(paper.categories)
+            )
 
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
+            summary = self._stream_chat_completion(
+                on_delta,
+                model=settings.DEEPSEEK_MODEL,
                 messages=[
-                    {"role": "system", "content": "你是专业的学术论文翻译和分析师，擅长将英文科技论文准确、完整地翻译成中文，并确保所有技术细节和专业术语的正确性。"},
+                    _SUMMARY_SYSTEM,
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=max_tokens,
@@ -110,72 +450,140 @@ class DeepSeekAnalyzer:
                 presence_penalty=0.1  # 鼓励引入新概念
             )
 
-            summary = response.choices[0].message.content.strip()
-
             # 检查翻译完整性 - 如果摘要过短，尝试重新生成
             if len(summary) < 100 and abstract_length > 500:
                 logger.warning(f"论文 {paper.arxiv_id} 的摘要可能不完整，尝试重新生成")
-                return self._regenerate_summary(paper, max_tokens)
+                summary = self._regenerate_summary(paper, max_tokens, on_delta)
+                if not summary:
+                    return None
+            else:
+                logger.info(f"成功生成论文 {paper.arxiv_id} 的摘要，长度：{len(summary)}字符")
 
-            logger.info(f"成功生成论文 {paper.arxiv_id} 的摘要，长度：{len(summary)}字符")
+            self.db.save_cached_summaries([(cache_key, settings.DEEPSEEK_MODEL, summary)])
             return summary
 
         except Exception as e:
             logger.error(f"生成论文摘要失败 {paper.arxiv_id}: {e}")
             return None
 
-    def analyze_papers_batch(self, papers: List[Paper]) -> List[Paper]:
+    def _summary_cache_key(self, paper: Paper) -> bytes:
+        """
+        计算摘要缓存键：模型、标题和英文摘要的blake2b哈希
+        标题和摘要先合并空白字符，arXiv重新抓取时仅换行或缩进不同的内容视为同一篇
+
+        生成摘要时temperature不为0，缓存保存的是首次生成的结果，之后相同输入一律复用
+        """
+        title = _collapse_whitespace(paper.title)
+        abstract = _collapse_whitespace(paper.abstract)
+        content = f"{settings.DEEPSEEK_MODEL}|{title}|{abstract}"
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+    def analyze_papers_batch(self, papers: List[Paper],
+                             on_progress: Optional[Callable[[int, int], None]] = None) -> List[Paper]:
         """
-        批量分析论文并生成摘要 - 改进版本，确保翻译质量
+        批量分析论文并生成摘要 - 将多篇论文打包到同一次请求中，并发处理多个批次
 
         Args:
             papers: 论文列表
+            on_progress: 进度回调，参数为(已处理数量, 总数量)
 
         Returns:
             已分析的论文列表
         """
-        analyzed_papers = []
+        analyzed_papers = list(papers)
         incomplete_count = 0
         retry_count = 0
 
-        for i, paper in enumerate(papers):
-            logger.info(f"分析论文进度: {i+1}/{len(papers)} - {paper.title[:50]}...")
-
-            # 检查是否已有摘要
+        # 只为尚无摘要的论文生成摘要，先查摘要缓存
+        pending_papers = [paper for paper in papers if not paper.summary]
+        cache_keys = {paper.arxiv_id: self._summary_cache_key(paper) for paper in pending_papers}
+        cached_summaries = self.db.get_cached_summaries(list(cache_keys.values()))
+        if cached_summaries:
+            for paper in pending_papers:
+                cached = cached_summaries.get(cache_keys[paper.arxiv_id])
+                if cached:
+                    paper.summary = cached
+                    self._update_paper_summary(paper.arxiv_id, cached)
+            logger.info(f"命中摘要缓存{len(cached_summaries)}篇")
+        new_cache_rows = []
+
+        # 内容相同的论文（如不同版本或不同关键词抓取到的同一篇）只生成一次
+        groups: Dict[bytes, List[Paper]] = {}
+        for paper in pending_papers:
             if not paper.summary:
-                summary = self.generate_summary(paper)
-                if summary:
-                    # 检查摘要完整性
-                    if len(summary) < 150 and len(paper.abstract) > 600:
-                        logger.warning(f"论文 {paper.arxiv_id} 摘要可能不完整，尝试重新生成")
-                        retry_summary = self._regenerate_summary(paper, 1500)
-                        if retry_summary and len(retry_summary) > len(summary):
-                            summary = retry_summary
+                groups.setdefault(cache_keys[paper.arxiv_id], []).append(paper)
+        unique_papers = [group[0] for group in groups.values()]
+        duplicate_count = sum(len(group) for group in groups.values()) - len(unique_papers)
+        if duplicate_count:
+            logger.info(f"发现{duplicate_count}篇内容重复的论文，将复用摘要")
+
+        # 未命中缓存的论文均匀切分成批次：批次数至少占满并发数，每批不超过SUMMARY_BATCH_SIZE篇，
+        # 论文较少时拆成更小的批次并行请求，避免少数大批次串行输出拖慢整体耗时
+        batch_size = max(1, settings.SUMMARY_BATCH_SIZE)
+        concurrency = max(1, settings.DEEPSEEK_MAX_CONCURRENCY)
+        chunk_count = max(-(-len(unique_papers) // batch_size), min(len(unique_papers), concurrency))
+        pending_papers = iter(unique_papers)
+        chunks = []
+        for i in range(chunk_count):
+            size = len(unique_papers) // chunk_count + (1 if i < len(unique_papers) % chunk_count else 0)
+            chunks.append(list(itertools.islice(pending_papers, size)))
+
+        if chunks:
+            max_workers = min(len(chunks), concurrency)
+            logger.info(f"开始并发分析论文：{len(chunks)}批，并发数{max_workers}")
+
+            # 已有摘要和命中缓存的论文计为已处理
+            processed = len(papers) - sum(len(group) for group in groups.values())
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self._summarize_chunk, chunk): chunk for chunk in chunks}
+
+                for future in as_completed(futures):
+                    chunk = futures[future]
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        logger.error(f"批次摘要生成异常: {e}")
+                        results = [(paper, None, False) for paper in chunk]
+
+                    processed += sum(len(groups[cache_keys[paper.arxiv_id]]) for paper in chunk)
+                    logger.info(f"分析论文进度: {processed}/{len(papers)}")
+                    if on_progress:
+                        on_progress(processed, len(papers))
+
+                    for paper, summary, retried in results:
+                        if not summary:
+                            logger.error(f"论文 {paper.arxiv_id} 摘要生成失败")
+                            continue
+
+                        if retried:
                             retry_count += 1
 
-                    paper.summary = summary
-                    # 更新数据库
-                    self._update_paper_summary(paper.arxiv_id, summary)
-
-                    # 记录摘要质量统计
-                    summary_length = len(summary)
-                    abstract_length = len(paper.abstract)
-                    ratio = summary_length / abstract_length if abstract_length > 0 else 0
-
-                    if ratio < 0.2 and abstract_length > 500:
-                        logger.warning(f"论文 {paper.arxiv_id} 摘要比例偏低：{ratio:.2f} ({summary_length}/{abstract_length})")
-                        incomplete_count += 1
-                    else:
-                        logger.info(f"论文 {paper.arxiv_id} 摘要生成成功，长度比例：{ratio:.2f}")
-                else:
-                    logger.error(f"论文 {paper.arxiv_id} 摘要生成失败")
-
-            analyzed_papers.append(paper)
-
-            # 添加延迟以避免API限制 - 根据摘要长度调整延迟
-            import time
-            delay = min(2, 1 + len(paper.abstract) / 5000)  # 长摘要增加延迟
-            time.sleep(delay)
+                        # 将摘要分发给所有内容相同的论文
+                        for same_paper in groups[cache_keys[paper.arxiv_id]]:
+                            same_paper.summary = summary
+                            self._update_paper_summary(same_paper.arxiv_id, summary)
+                        new_cache_rows.append((cache_keys[paper.arxiv_id], settings.DEEPSEEK_MODEL, summary))
+
+                        # 记录摘要质量统计
+                        summary_length = len(summary)
+                        abstract_length = len(paper.abstract)
+                        ratio = summary_length / abstract_length if abstract_length > 0 else 0
+
+                        if ratio < 0.2 and abstract_length > 500:
+                            logger.warning(f"论文 {paper.arxiv_id} 摘要比例偏低：{ratio:.2f} ({summary_length}/{abstract_length})")
+                            incomplete_count += 1
+                        else:
+                            logger.info(f"论文 {paper.arxiv_id} 摘要生成成功，长度比例：{ratio:.2f}")
+
+                    # 定期分批写回，中途中断时已完成的摘要不会丢失
+                    if len(new_cache_rows) >= _SUMMARY_FLUSH_SIZE:
+                        self.flush_updates()
+                        self.db.save_cached_summaries(new_cache_rows)
+                        new_cache_rows = []
+
+        # 在单个事务中写回数据库
+        self.flush_updates()
+        self.db.save_cached_summaries(new_cache_rows)
 
         # 报告批量分析结果
         total_analyzed = len([p for p in analyzed_papers if p.summary])
@@ -183,36 +591,274 @@ class DeepSeekAnalyzer:
 
         return analyzed_papers
 
+    def _summarize_chunk(self, papers: List[Paper]) -> List[Tuple[Paper, Optional[str], bool]]:
+        """
+        为一个批次的论文生成摘要（在线程池中执行）
+
+        Args:
+            papers: 同一批次的论文列表
+
+        Returns:
+            (论文, 摘要, 是否重新生成) 元组列表，摘要生成失败时为None
+        """
+        try:
+            chunk_summaries = self._generate_summaries_chunk(papers)
+        except Exception as e:
+            logger.error(f"批量生成摘要失败，改为逐篇生成: {e}")
+            chunk_summaries = {}
+
+        results = []
+        for paper in papers:
+            summary = chunk_summaries.get(paper.arxiv_id)
+            if not summary:
+                # 批量结果中缺失的论文单独生成
+                logger.warning(f"论文 {paper.arxiv_id} 未包含在批量结果中，单独生成摘要")
+                summary = self.generate_summary(paper)
+
+            retried = False
+            # 检查摘要完整性
+            if summary and len(summary) < 150 and len(paper.abstract) > 600:
+                logger.warning(f"论文 {paper.arxiv_id} 摘要可能不完整，尝试重新生成")
+                retry_summary = self._regenerate_summary(paper, 1500)
+                if retry_summary and len(retry_summary) > len(summary):
+                    summary = retry_summary
+                    retried = True
+
+            results.append((paper, summary, retried))
+
+        return results
+
+    def _generate_summaries_chunk(self, papers: List[Paper]) -> Dict[str, str]:
+        """
+        在一次请求中为多篇论文生成中文摘要
+
+        Args:
+            papers: 同一批次的论文列表
+
+        Returns:
+            arxiv_id到摘要的映射，解析失败或缺失的论文不包含在内
+        """
+        papers_text = "\n\n".join(
+            f"[{paper.arxiv_id}]\n"
+            f"标题：{paper.title}\n"
+            f"作者：{', '.join(paper.authors)}\n"
+            f"英文摘要：{paper.abstract}\n"
+            f"分类：{', '.join(paper.categories)}"
+            for paper in papers
+        )
+
+        prompt = f"""
+请为以下{len(papers)}篇论文分别生成完整、准确的中文摘要，每篇论文以方括号中的arXiv ID标识：
+
+{papers_text}
+
+要求：
+1. 必须完整翻译和概括每篇论文的所有重要信息，不能遗漏关键内容
+2. 突出研究背景、主要贡献、方法创新、实验结果和结论
+3. 使用专业的学术中文表达，术语准确
+4. 根据原文长度，每篇中文摘要应在300-800字之间
+5. 确保技术细节和方法描述的完整性
+6. 以JSON对象返回结果，键为论文的arXiv ID，值为对应的中文摘要，例如：{{"2501.00001": "中文摘要"}}
+"""
+
+        response = self._create_chat_completion(
+            model=settings.DEEPSEEK_MODEL,
+            messages=[
+                _SUMMARY_SYSTEM,
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=min(8000, 1000 * len(papers)),  # DeepSeek单次输出上限为8K
+            temperature=0.5,
+            top_p=0.9,
+            response_format={"type": "json_object"}
+        )
+
+        content = response.choices[0].message.content or ""
+        try:
+            result = json.loads(content)
+        except json.JSONDecodeError as e:
+            logger.warning(f"批量摘要结果不是合法JSON: {e}")
+            return {}
+
+        if not isinstance(result, dict):
+            logger.warning("批量摘要结果格式不正确，期望JSON对象")
+            return {}
+
+        requested_ids = {paper.arxiv_id for paper in papers}
+        summaries = {}
+        for arxiv_id, summary in result.items():
+            arxiv_id = str(arxiv_id).strip("[] ")
+            if arxiv_id in requested_ids and isinstance(summary, str) and summary.strip():
+                summaries[arxiv_id] = summary.strip()
+
+        logger.info(f"批量生成摘要完成：请求{len(papers)}篇，返回{len(summaries)}篇")
+        return summaries
+
+    def _create_chat_completion(self, max_attempts: int = 5, **kwargs):
+        """
+        调用DeepSeek对话接口，遇到限流(429)、连接失败、超时或服务端错误时按指数退避重试
+        并发请求数受DEEPSEEK_MAX_CONCURRENCY限制，请求速率受DEEPSEEK_RPM和DEEPSEEK_TPM限制
+        流式请求返回时仍占用并发名额，调用方读完或关闭流后须调用 _api_semaphore.release()
+
+        Args:
+            max_attempts: 最大尝试次数
+            **kwargs: 透传给chat.completions.create的参数
+
+        Returns:
+            API响应对象
+        """
+        # 按输入消息估算的token数加上输出上限计入TPM额度
+        estimated_tokens = sum(
+            _estimate_tokens(message.get('content') or '') for message in kwargs.get('messages', [])
+        ) + kwargs.get('max_tokens', 0)
+
+        for attempt in range(1, max_attempts + 1):
+            try:
+                _request_bucket.acquire()
+                _token_bucket.acquire(estimated_tokens)
+                _api_semaphore.acquire()
+                try:
+                    response = self.client.chat.completions.create(**kwargs)
+                except BaseException:
+                    _api_semaphore.release()
+                    raise
+                # 非流式响应已读取完毕，立即归还名额；流式响应由调用方读完后归还
+                if not kwargs.get('stream'):
+                    _api_semaphore.release()
+                return response
+            except _RETRYABLE_ERRORS as e:
+                if isinstance(e, openai.RateLimitError):
+                    # 服务端已限流，说明配置的额度偏高，暂时放慢所有请求
+                    _request_bucket.throttle()
+                    _token_bucket.throttle()
+                if attempt == max_attempts:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(f"API请求失败({type(e).__name__})，{delay:.1f}秒后进行第{attempt + 1}次尝试: {e}")
+                time.sleep(delay)
+
+    def _stream_chat_completion(self, on_delta: Optional[Callable[[str], None]] = None, **kwargs) -> str:
+        """
+        以流式方式调用对话接口，边接收边回调
+
+        Args:
+            on_delta: 每收到一段文本时调用的回调函数
+            **kwargs: 透传给chat.completions.create的参数
+
+        Returns:
+            完整的回复文本
+        """
+        response = self._create_chat_completion(stream=True, **kwargs)
+
+        pieces = []
+        try:
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                pieces.append(delta)
+                if on_delta:
+                    on_delta(delta)
+        finally:
+            # 回调出错等提前退出时及时关闭流，不再继续接收剩余输出；流关闭后归还并发名额
+            try:
+                response.close()
+            finally:
+                _api_semaphore.release()
+
+        return "".join(pieces).strip()
+
+    def _cached_chat(self, on_delta: Optional[Callable[[str], None]] = None, warm_up: bool = False,
+                     **kwargs) -> str:
+        """
+        带持久化缓存的对话调用：相同的模型、消息和参数直接返回数据库中的响应
+
+        Args:
+            on_delta: 流式输出回调，仅在未命中缓存时调用
+            warm_up: 未命中缓存时是否先在后台预热API连接
+            **kwargs: 透传给chat.completions.create的参数
+
+        Returns:
+            完整的回复文本
+        """
+        prompt_hash = hashlib.blake2b(
+            json.dumps(kwargs, ensure_ascii=False, sort_keys=True).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+
+        cached = self.db.get_llm_cache(prompt_hash)
+        if cached is not None:
+            logger.info("命中LLM响应缓存")
+            return cached
+
+        if warm_up:
+            # 确定要请求API后才预热：等待限速和并发名额的同时在后台建立连接
+            threading.Thread(target=_warm_up_connection, daemon=True).start()
+
+        response = self._stream_chat_completion(on_delta, **kwargs)
+        if response:
+            self.db.save_llm_cache(prompt_hash, kwargs.get('model', ''), response)
+        return response
+
     def _update_paper_summary(self, arxiv_id: str, summary: str):
-        """更新数据库中的论文摘要"""
+        """将论文摘要加入待写队列，由flush_updates统一写回数据库"""
+        with self._pending_lock:
+            self._pending_updates.append((summary, arxiv_id))
+        return True
+
+    def flush_updates(self) -> int:
+        """
+        将待写队列中的摘要在单个事务中写回数据库
+
+        Returns:
+            实际更新的记录数
+        """
+        with self._pending_lock:
+            batch, self._pending_updates = self._pending_updates, []
+        return self._update_paper_summaries_bulk(batch)
+
+    def _update_paper_summaries_bulk(self, rows: List[Tuple[str, str]]) -> int:
+        """
+        在单个事务中批量更新论文摘要
+
+        Args:
+            rows: (summary, arxiv_id) 元组列表
+
+        Returns:
+            实际更新的记录数
+        """
+        if not rows:
+            return 0
+
         try:
-            import sqlite3
-            with sqlite3.connect(self.db.db_path) as conn:
-                cursor = conn.execute(
+            # 复用当前线程的长连接，在单个事务中完成全部更新；
+            # BEGIN IMMEDIATE一开始就取得写锁，避免事务中途升级写锁时与其他写入方冲突
+            conn = self.db.conn
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.executemany(
                     "UPDATE papers SET summary = ? WHERE arxiv_id = ?",
-                    (summary, arxiv_id)
+                    rows
                 )
-                conn.commit()
 
-                # 检查是否真正更新了记录
-                if cursor.rowcount > 0:
-                    logger.info(f"成功更新论文摘要: {arxiv_id}")
-                    return True
-                else:
-                    logger.warning(f"未找到要更新的论文: {arxiv_id}")
-                    return False
+            logger.info(f"批量更新论文摘要：{cursor.rowcount}/{len(rows)}篇")
+            return cursor.rowcount
 
         except Exception as e:
-            logger.error(f"更新论文摘要失败 {arxiv_id}: {e}")
-            return False
+            logger.error(f"批量更新论文摘要失败: {e}")
+            return 0
 
-    def _regenerate_summary(self, paper: Paper, max_tokens: int) -> Optional[str]:
+    def _regenerate_summary(self, paper: Paper, max_tokens: int,
+                            on_delta: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """
         重新生成摘要 - 用于处理不完整的翻译
 
         Args:
             paper: 论文对象
             max_tokens: token限制
+            on_delta: 流式输出回调，每收到一段文本调用一次
 
         Returns:
             重新生成的摘要
@@ -236,18 +882,17 @@ class DeepSeekAnalyzer:
 请提供完整详细的中文摘要：
 """
 
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
+            summary = self._stream_chat_completion(
+                on_delta,
+                model=settings.DEEPSEEK_MODEL,
                 messages=[
-                    {"role": "system", "content": "你是专业的学术论文翻译专家，确保将英文论文内容完整、准确地翻译成中文，不遗漏任何重要信息。"},
+                    _REGENERATE_SYSTEM,
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=max_tokens,
                 temperature=0.7,  # 提高温度以增加详细程度
                 top_p=0.95
             )
-
-            summary = response.choices[0].message.content.strip()
             logger.info(f"重新生成论文 {paper.arxiv_id} 的摘要，长度：{len(summary)}字符")
             return summary
 
@@ -255,51 +900,126 @@ class DeepSeekAnalyzer:
             logger.error(f"重新生成摘要失败 {paper.arxiv_id}: {e}")
             return None
 
-    def get_research_insights(self, days: int = 7) -> str:
+    def get_research_insights(self, days: int = 7, on_delta: Optional[Callable[[str], None]] = None,
+                              use_memo: bool = True, papers: Optional[List[Paper]] = None) -> str:
         """
         基于最近的论文生成研究洞察（智能缓存版本）
         如果数据库未更新，使用永久缓存；如果数据库更新了，重新生成并缓存
 
         Args:
             days: 分析的天数
+            on_delta: 流式输出回调，重新生成时每收到一段文本调用一次
+            use_memo: 是否使用进程内短期缓存
+            papers: 调用方已查询的最近论文，为None时从数据库查询
 
         Returns:
             研究洞察文本
         """
         cache_key = f"insights_{days}"
 
-        try:
-            # 检查是否正在生成洞察，避免重复生成
-            if cache_key in self._generating_insights:
-                logger.info(f"洞察 {cache_key} 正在生成中，返回现有缓存")
+        # 短时间内的重复请求直接返回内存中的结果，跳过数据哈希计算
+        if use_memo:
+            memo_key = self._insights_memo_key(days)
+            with _insights_memo_lock:
+                memo = _insights_memo.get(memo_key)
+                if memo is not None:
+                    _insights_memo.move_to_end(memo_key)
+                    return memo
+
+        # 数据未变化时直接返回数据库缓存，无需进入生成流程
+        cached_insights = self._get_fresh_cached_insights(days, cache_key)
+        if cached_insights is not None:
+            return cached_insights
+
+        # 同一洞察只允许一个线程生成，其余调用者等待并共享同一结果
+        inflight_key = (self.db.db_path, cache_key)
+        with _inflight_insights_lock:
+            future = _inflight_insights.get(inflight_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                _inflight_insights[inflight_key] = future
+
+        if not is_owner:
+            logger.info(f"洞察 {cache_key} 正在生成中，等待生成结果")
+            try:
+                return future.result(timeout=_INSIGHTS_WAIT_TIMEOUT)
+            except FutureTimeoutError:
+                # 生成耗时过长时不再阻塞调用方，先返回上一次缓存的洞察
+                logger.warning(f"等待洞察 {cache_key} 生成超时，返回已有缓存")
                 cached_data = self.db.get_insights_cache(cache_key)
-                if cached_data:
+                if cached_data and cached_data.get('insights'):
                     return cached_data['insights']
-                else:
-                    return "洞察正在生成中，请稍后刷新..."
+                return "洞察正在生成中，请稍后刷新页面查看。"
 
-            # 获取当前数据的哈希值
-            current_hash = self.db.get_data_hash(days)
+        try:
+            insights = self._generate_research_insights(days, cache_key, on_delta, papers)
+            future.set_result(insights)
+            return insights
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_insights_lock:
+                _inflight_insights.pop(inflight_key, None)
 
-            # 检查是否有缓存的洞察且数据未变化
-            cached_data = self.db.get_insights_cache(cache_key)
+    def is_generating_insights(self, days: int) -> bool:
+        """检查指定天数的洞察是否正在生成"""
+        with _inflight_insights_lock:
+            return (self.db.db_path, f"insights_{days}") in _inflight_insights
+
+    def _get_fresh_cached_insights(self, days: int, cache_key: str) -> Optional[str]:
+        """
+        数据哈希与缓存一致时返回数据库中缓存的洞察
+
+        Args:
+            days: 分析的天数
+            cache_key: 洞察缓存键
 
+        Returns:
+            缓存的洞察文本，缓存不存在或数据已变化时为None
+        """
+        try:
+            current_hash = self.db.get_data_hash(days)
+            cached_data = self.db.get_insights_cache(cache_key)
             if cached_data and cached_data.get('data_hash') == current_hash:
                 logger.info(f"数据库未更新，使用永久缓存的洞察数据: {cache_key}")
+                self._remember_insights(days, cached_data['insights'])
                 return cached_data['insights']
+        except Exception as e:
+            logger.error(f"检查洞察缓存失败: {e}")
+        return None
 
-            logger.info(f"检测到数据库更新，重新生成洞察: {cache_key} (hash: {current_hash[:8]}...)")
+    def _generate_research_insights(self, days: int, cache_key: str,
+                                    on_delta: Optional[Callable[[str], None]] = None,
+                                    papers: Optional[List[Paper]] = None) -> str:
+        """
+        检查数据哈希，必要时调用API重新生成洞察并写入缓存
+
+        Args:
+            days: 分析的天数
+            cache_key: 洞察缓存键
+            on_delta: 流式输出回调
+            papers: 调用方已查询的最近论文，为None时从数据库查询
+
+        Returns:
+            研究洞察文本
+        """
+        try:
+            # 等待期间其他线程可能已生成完毕，再检查一次缓存
+            cached_insights = self._get_fresh_cached_insights(days, cache_key)
+            if cached_insights is not None:
+                return cached_insights
 
-            # 添加到生成中集合
-            self._generating_insights.add(cache_key)
+            current_hash = self.db.get_data_hash(days)
+            logger.info(f"检测到数据库更新，重新生成洞察: {cache_key} (hash: {current_hash[:8]}...)")
 
             # 数据变化了，需要重新生成洞察
-            papers = self.db.get_recent_papers(days)
+            if papers is None:
+                papers = self.db.get_recent_papers(days)
             if not papers:
                 return "没有找到最近的论文数据。"
 
-            # 准备论文信息用于分析
-            papers_info = []
             # 根据时间范围和论文数量动态调整分析数量
             total_papers = len(papers)
 
@@ -315,70 +1035,64 @@ class DeepSeekAnalyzer:
             else:
                 # 论文很多时，分析固定数量以保证效率和质量
                 papers_to_analyze = papers[:30]  # 增加到30篇以获得更好的洞察
-            for i, paper in enumerate(papers_to_analyze):
-                papers_info.append({
-                    'index': i + 1,
-                    'title': paper.title,
-                    'summary': paper.summary or paper.abstract[:400],  # 稍微缩短摘要
-                    'categories': paper.categories,
-                    'authors': paper.authors[:3] if paper.authors else []  # 只取前3个作者
-                })
-
-            prompt = f"""
-你是一个专业的学术分析师。请基于最近{days}天的研究论文进行分析：
-
-**数据概况：**
-- 时间范围：最近{days}天
-- 总论文数：{total_papers}篇
-- 深度分析：{len(papers_to_analyze)}篇（{len(papers_to_analyze)/total_papers*100:.1f}%）
 
-分析论文：
-{papers_info}
-
-请提供深入的研究洞察分析，使用优美的Markdown格式，包括：
-
-## 🔬 研究趋势分析
-识别当前最主要的研究热点和趋势方向
-
-## ⚡ 技术突破点
-找出重要的技术创新和方法突破
-
-## 🔗 跨学科融合
-识别不同研究领域之间的交叉融合趋势
-
-## 🔮 未来展望
-基于当前研究趋势预测未来发展方向
-
-## 👥 关键研究团队
-识别活跃的研究机构和作者群体
-
-格式要求：
-- 用中文回答，使用优雅的Markdown格式
-- 每个主要部分使用合适的emoji图标
-- 重要概念和关键词使用**加粗**强调
-- 技术术语和方法使用`代码格式`标注
-- 适当使用引用块>突出重点观点
-- 确保内容结构清晰，层次分明
-- 字数控制在800-1200字之间
-- 基于实际论文内容进行分析，不要泛泛而谈
-"""
-
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
-                messages=[
-                    {"role": "system", "content": "你是一个专业的研究趋势分析师，擅长从学术论文中提取有价值的洞察。"},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=3000,  # 增加token限制以支持更长的分析
-                temperature=0.3,   # 降低随机性，提高稳定性
+            # 准备论文信息用于分析，标题与正文在构造时一次性处理
+            papers_info = [
+                {
+                    # 先合并arXiv文本中的换行和缩进，token预算只花在内容上
+                    'title': _truncate_tokens(_collapse_whitespace(paper.title), _INSIGHTS_TITLE_TOKENS),
+                    # 无中文摘要时使用英文摘要，均按token预算截断
+                    'summary': _truncate_tokens(_collapse_whitespace(paper.summary or paper.abstract),
+                                                _INSIGHTS_SUMMARY_TOKENS),
+                    'categories': paper.categories,
+                    'authors': [author.strip() for author in paper.authors[:3]]  # 只取前3个作者
+                }
+                for paper in papers_to_analyze
+            ]
+
+            prompt = INSIGHTS_TMPL.substitute(
+                days=days,
+                total_papers=total_papers,
+                analyzed_count=len(papers_to_analyze),
+                analyzed_ratio=f"{len(papers_to_analyze) / total_papers * 100:.1f}",
+                payload=json.dumps(papers_info, ensure_ascii=False, separators=(',', ':'))
             )
+            logger.info(f"洞察请求预计输入约{_estimate_tokens(INSIGHTS_INSTRUCTIONS) + _estimate_tokens(prompt)}个token")
+
+            # 流式接收的内容定期写入进度表，供界面渐进展示
+            received = []
+            last_saved = time.monotonic()
+
+            def record_delta(delta: str):
+                nonlocal last_saved
+                received.append(delta)
+                if on_delta:
+                    on_delta(delta)
+                now = time.monotonic()
+                if now - last_saved >= _INSIGHTS_PROGRESS_INTERVAL:
+                    self.db.save_insights_progress(cache_key, "".join(received))
+                    last_saved = now
+
+            try:
+                insights = self._stream_chat_completion(
+                    record_delta,
+                    model=settings.DEEPSEEK_MODEL,
+                    messages=[
+                        _INSIGHTS_SYSTEM,
+                        _INSIGHTS_INSTRUCTIONS_MESSAGE,
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=3000,  # 增加token限制以支持更长的分析
+                    temperature=0.3,   # 降低随机性，提高稳定性
+                )
+            finally:
+                self.db.clear_insights_progress(cache_key)
 
-            insights = response.choices[0].message.content.strip()
             logger.info("成功生成研究洞察")
 
             # 同时获取热门主题并保存到缓存
             try:
-                trending_topics = self.get_trending_topics(days)
+                trending_topics = self.get_trending_topics(days, data_hash=current_hash)
 
                 # 保存到数据库缓存
                 self.db.save_insights_cache(cache_key, current_hash, insights, trending_topics)
@@ -392,22 +1106,67 @@ class DeepSeekAnalyzer:
                 except Exception as cache_e:
                     logger.error(f"保存缓存失败: {cache_e}")
 
+            self._remember_insights(days, insights)
             return insights
 
         except Exception as e:
             logger.error(f"生成研究洞察失败: {e}")
             return f"生成洞察失败: {str(e)}"
-        finally:
-            # 确保从生成中集合中移除，即使出现异常
-            if cache_key in self._generating_insights:
-                self._generating_insights.remove(cache_key)
 
-    def auto_update_insights_if_needed(self, days: int = 7) -> bool:
+    def _insights_memo_key(self, days: int) -> Tuple[str, int, int]:
+        """计算洞察短期缓存的键"""
+        return (self.db.db_path, days, int(time.time() // _INSIGHTS_MEMO_TTL))
+
+    def _remember_insights(self, days: int, insights: str):
+        """将洞察写入短期缓存，超出容量时淘汰最久未使用的条目"""
+        memo_key = self._insights_memo_key(days)
+        with _insights_memo_lock:
+            _insights_memo[memo_key] = insights
+            _insights_memo.move_to_end(memo_key)
+            while len(_insights_memo) > _INSIGHTS_MEMO_MAX:
+                _insights_memo.popitem(last=False)
+
+    def clear_insights_memo(self, days: Optional[int] = None):
+        """
+        清除当前数据库的洞察短期缓存
+
+        Args:
+            days: 只清除指定天数的缓存，为None时清除全部
+        """
+        with _insights_memo_lock:
+            for key in [k for k in _insights_memo
+                        if k[0] == self.db.db_path and (days is None or k[1] == days)]:
+                del _insights_memo[key]
+
+    def schedule_insights_update(self, days: int = 7) -> Future:
+        """
+        将洞察更新检查交给后台工作线程执行，立即返回
+
+        Args:
+            days: 分析的天数
+
+        Returns:
+            结果为auto_update_insights_if_needed返回值的Future
+        """
+        global _insights_worker
+        with _insights_worker_lock:
+            if _insights_worker is None or not _insights_worker.is_alive():
+                _insights_worker = threading.Thread(
+                    target=_run_insights_worker, name="insights-worker", daemon=True
+                )
+                _insights_worker.start()
+
+        future = Future()
+        _insights_jobs.put((self, days, future))
+        return future
+
+    def auto_update_insights_if_needed(self, days: int = 7, papers: Optional[List[Paper]] = None) -> bool:
         """
         检查数据库是否更新，如果更新了则自动生成新的洞察（后台任务用）
 
         Args:
             days: 分析的天数
+            papers: 调用方已查询的最近论文，为None时需要生成时再从数据库查询
 
         Returns:
             是否更新了洞察
@@ -418,14 +1177,12 @@ class DeepSeekAnalyzer:
             # 获取当前数据的哈希值
             current_hash = self.db.get_data_hash(days)
 
-            # 检查缓存的数据哈希
-            cached_data = self.db.get_insights_cache(cache_key)
-
-            if not cached_data or cached_data.get('data_hash') != current_hash:
+            # 检查缓存的数据哈希（只读取哈希列，不取洞察正文）
+            if self.db.get_insights_cache_hash(cache_key) != current_hash:
                 logger.info(f"检测到数据库更新，后台自动生成洞察: {cache_key}")
 
                 # 异步生成洞察
-                insights = self.get_research_insights(days)
+                insights = self.get_research_insights(days, use_memo=False, papers=papers)
 
                 if insights and not insights.startswith("生成洞察失败"):
                     logger.info(f"后台洞察生成成功: {cache_key}")
@@ -441,100 +1198,74 @@ class DeepSeekAnalyzer:
             logger.error(f"自动更新洞察检查失败: {e}")
             return False
 
-    def get_trending_topics(self, days: int = 7) -> List[str]:
+    def get_trending_topics(self, days: int = 7, data_hash: Optional[str] = None) -> List[str]:
         """
         获取热门研究主题
-        基于最近论文的标题和摘要分析出高频关键词
+        基于最近论文的标题和摘要分析出高频关键词，数据未变化时直接使用缓存
 
         Args:
             days: 分析的天数
+            data_hash: 调用方已计算的数据哈希值，为None时重新计算
 
         Returns:
             热门主题列表
         """
+        cache_key = f"trending_{days}"
         try:
-            papers = self.db.get_recent_papers(days)
-            if not papers:
+            current_hash = data_hash or self.db.get_data_hash(days)
+            cached_data = self.db.get_insights_cache(cache_key)
+            if cached_data and cached_data.get('data_hash') == current_hash:
+                return cached_data['trending']
+
+            # 只查询标题和正文两列（如果有生成摘要则用摘要，否则用原摘要）
+            texts = [title + " " + body for title, body in self.db.iter_recent_text(days)]
+            if not texts:
                 return []
 
-            # 收集所有标题和摘要中的关键词
-            all_text = []
-            for paper in papers:
-                # 使用标题和摘要（如果有生成摘要则用摘要，否则用原摘要）
-                text = paper.title.lower()
-                summary_text = paper.summary if paper.summary else paper.abstract
-                text += " " + summary_text.lower()
-                all_text.append(text)
-
-            # 常见的技术词汇过滤
-            common_words = {
-                'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-                'by', 'from', 'we', 'our', 'this', 'that', 'these', 'those', 'is', 'are', 'was',
-                'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                'can', 'could', 'may', 'might', 'should', 'shall', 'must', 'paper', 'study',
-                'research', 'analysis', 'approach', 'method', 'model', 'system', 'algorithm',
-                'propose', 'present', 'show', 'demonstrate', 'evaluate', 'performance', 'result'
-            }
-
-            # 简单的关键词提取
-            import re
-            word_count = {}
-
-            for text in all_text:
-                # 提取单词（保留技术术语）
-                words = re.findall(r'\b[a-zA-Z-]{3,}\b', text)
-                for word in words:
-                    if word not in common_words and len(word) > 3:
-                        word_count[word] = word_count.get(word, 0) + 1
-
-            # 获取出现频率最高的关键词
-            sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
+            word_count = _count_topic_words(texts)
 
             # 返回前10个热门关键词
-            trending_topics = [word for word, count in sorted_words[:10] if count >= 2]
+            trending_topics = [word for word, count in word_count.most_common(10) if count >= 2]
 
             logger.info(f"提取到{len(trending_topics)}个热门主题")
+            self.db.save_insights_cache(cache_key, current_hash, "", trending_topics)
             return trending_topics
 
         except Exception as e:
             logger.error(f"获取热门主题失败: {e}")
             return []
 
-    def compare_papers(self, paper_ids: List[str]) -> str:
+    def compare_papers(self, paper_ids: List[str], on_delta: Optional[Callable[[str], None]] = None) -> str:
         """
         比较多篇论文的异同
 
         Args:
             paper_ids: 论文arXiv ID列表
+            on_delta: 流式输出回调，每收到一段文本调用一次
 
         Returns:
             比较分析结果
         """
         try:
+            # 一次查询取回所有论文，再按输入顺序整理
+            rows = self.db.get_papers_by_arxiv_ids(paper_ids)
+
             papers = []
             found_ids = []
             missing_ids = []
 
             for paper_id in paper_ids:
-                # 从数据库获取论文
-                import sqlite3
-                with sqlite3.connect(self.db.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        "SELECT title, abstract, summary FROM papers WHERE arxiv_id = ?",
-                        (paper_id,)
-                    )
-                    result = cursor.fetchone()
-                    if result:
-                        papers.append({
-                            'id': paper_id,
-                            'title': result[0],
-                            'abstract': result[1],
-                            'summary': result[2] or result[1][:500]
-                        })
-                        found_ids.append(paper_id)
-                    else:
-                        missing_ids.append(paper_id)
+                result = rows.get(paper_id)
+                if result:
+                    papers.append({
+                        'id': paper_id,
+                        'title': result['title'],
+                        'abstract': result['abstract'][:300],
+                        'summary': result['summary'] or result['abstract'][:500]
+                    })
+                    found_ids.append(paper_id)
+                else:
+                    missing_ids.append(paper_id)
 
             # 如果有缺失的论文，提供详细错误信息
             if missing_ids:
@@ -551,32 +1282,21 @@ class DeepSeekAnalyzer:
             if len(papers) < 2:
                 return "需要至少两篇论文进行比较。"
 
-            prompt = f"""
-请比较分析以下几篇论文的异同点：
-
-{papers}
-
-请从以下几个方面进行比较：
-1. 研究目标和问题的异同
-2. 方法论的区别
-3. 主要贡献和创新点
-4. 优缺点对比
-5. 适用场景的差异
-
-请用中文回答，结构化输出。
-"""
+            prompt = COMPARE_TMPL.substitute(
+                payload=json.dumps(papers, ensure_ascii=False, separators=(',', ':'))
+            )
 
-            response = self.client.chat.completions.create(
-                model="deepseek-chat",
+            comparison = self._cached_chat(
+                on_delta,
+                warm_up=True,
+                model=settings.DEEPSEEK_MODEL,
                 messages=[
-                    {"role": "system", "content": "你是一个专业的学术比较分析师，擅长深入分析和比较不同研究论文。"},
+                    _COMPARE_SYSTEM,
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=1000,
                 temperature=0.3
             )
-
-            comparison = response.choices[0].message.content.strip()
             logger.info(f"成功完成 {len(papers)} 篇论文的比较分析")
             return comparison
 
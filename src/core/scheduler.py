@@ -1,8 +1,11 @@
+import os
 import schedule
-import time
+import threading
 import logging
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
 from src.core.scraper import ArxivScraper
 from src.core.analyzer import DeepSeekAnalyzer
 from config.settings import settings
@@ -14,6 +17,20 @@ class PaperScheduler:
         self.scraper = ArxivScraper()
         self.analyzer = DeepSeekAnalyzer()
         self.is_running = False
+        # 主循环等待下一个任务时使用，stop()时设置以立即退出
+        self._wakeup = threading.Event()
+        # 后台分析线程：同一时间只运行一次分析，摘要生成本身已在分析器内部并发
+        # 首次提交分析时创建，stop()关闭后下次提交时重新创建
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._analysis_future: Optional[Future] = None
+        # 报告输出目录只在启动时创建一次
+        self.insights_dir = Path("insights")
+        self.reports_dir = Path("reports")
+        self.trends_dir = Path("trends")
+        for directory in (self.insights_dir, self.reports_dir, self.trends_dir):
+            os.makedirs(directory, exist_ok=True)
+        # 启动时先刷新一次查询规划器的统计信息
+        self.scraper.db.optimize()
 
     def daily_scrape_task(self):
         """每日爬取任务"""
@@ -27,37 +44,13 @@ class PaperScheduler:
 
             if saved_count > 0:
                 logger.info(f"成功爬取并保存了 {saved_count} 篇新论文")
+                # 摘要生成和洞察更新耗时较长，交给后台线程执行，主循环继续调度其他任务
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1)
+                self._analysis_future = self._executor.submit(self._analyze_and_update_insights, start_time)
 
-                # 获取今天的论文并生成摘要
-                recent_papers = self.scraper.db.get_recent_papers(1)
-                if recent_papers:
-                    logger.info("开始生成论文摘要...")
-                    analyzed_papers = self.analyzer.analyze_papers_batch(recent_papers)
-
-                # 数据库更新后，自动更新洞察缓存（不同时间范围的）
-                logger.info("数据库已更新，开始自动更新洞察缓存...")
-
-                # 更新不同时间范围的洞察
-                for days in [1, 7, 30]:
-                    try:
-                        updated = self.analyzer.auto_update_insights_if_needed(days)
-                        if updated:
-                            logger.info(f"成功更新 {days} 天洞察缓存")
-                        else:
-                            logger.info(f"{days} 天洞察缓存已是最新，无需更新")
-                    except Exception as e:
-                        logger.error(f"更新 {days} 天洞察缓存失败: {e}")
-
-                # 生成今日洞察用于文件保存
-                insights = self.analyzer.get_research_insights(1)
-                if insights and not insights.startswith("生成洞察失败"):
-                    logger.info(f"今日研究洞察：\n{insights}")
-                    # 保存洞察到文件
-                    self._save_daily_insights(insights, start_time)
-
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            logger.info(f"每日任务完成，耗时: {duration:.2f} 秒")
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.info(f"每日爬取完成，耗时: {duration:.2f} 秒")
 
             return saved_count
 
@@ -65,14 +58,48 @@ class PaperScheduler:
             logger.error(f"每日爬取任务执行失败: {e}")
             return 0
 
+    def _analyze_and_update_insights(self, start_time: datetime):
+        """为新论文生成摘要并更新洞察缓存（在后台线程中执行）"""
+        try:
+            # 获取今天的论文并生成摘要
+            recent_papers = self.scraper.db.get_recent_papers(1)
+            if recent_papers:
+                logger.info("开始生成论文摘要...")
+                self.analyzer.analyze_papers_batch(recent_papers)
+
+            # 数据库更新后，自动更新洞察缓存（不同时间范围的）
+            logger.info("数据库已更新，开始自动更新洞察缓存...")
+
+            # 更新不同时间范围的洞察，三个时间范围的论文只查询一次
+            papers_by_window = self.analyzer.db.get_recent_papers_by_windows([1, 7, 30])
+            for days in [1, 7, 30]:
+                try:
+                    updated = self.analyzer.auto_update_insights_if_needed(days, papers=papers_by_window[days])
+                    if updated:
+                        logger.info(f"成功更新 {days} 天洞察缓存")
+                    else:
+                        logger.info(f"{days} 天洞察缓存已是最新，无需更新")
+                except Exception as e:
+                    logger.error(f"更新 {days} 天洞察缓存失败: {e}")
+
+            # 生成今日洞察用于文件保存
+            insights = self.analyzer.get_research_insights(1)
+            if insights and not insights.startswith("生成洞察失败"):
+                logger.info(f"今日研究洞察：\n{insights}")
+                # 保存洞察到文件
+                self._save_daily_insights(insights, start_time)
+
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.info(f"每日任务完成，耗时: {duration:.2f} 秒")
+
+        except Exception as e:
+            logger.error(f"每日分析任务执行失败: {e}")
+
     def _save_daily_insights(self, insights: str, date: datetime):
         """保存每日研究洞察到文件"""
         try:
             filename = f"daily_insights_{date.strftime('%Y%m%d')}.txt"
-            filepath = f"insights/{filename}"
-
-            import os
-            os.makedirs("insights", exist_ok=True)
+            filepath = self.insights_dir / filename
 
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(f"日期: {date.strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -96,8 +123,8 @@ class PaperScheduler:
                 logger.info(f"本周研究趋势：\n{insights}")
                 self._save_weekly_report(insights)
 
-            # 获取热门主题
-            trending_topics = self.scraper.get_trending_topics(7)
+            # 获取热门主题（数据未变化时复用缓存）
+            trending_topics = self.analyzer.get_trending_topics(7)
             if trending_topics:
                 logger.info(f"本周热门主题: {', '.join(trending_topics)}")
                 self._save_trending_topics(trending_topics)
@@ -108,13 +135,9 @@ class PaperScheduler:
     def _save_weekly_report(self, insights: str):
         """保存周度报告"""
         try:
-            from datetime import timedelta
             week_start = datetime.now() - timedelta(days=datetime.now().weekday())
             filename = f"weekly_report_{week_start.strftime('%Y%m%d')}.txt"
-            filepath = f"reports/{filename}"
-
-            import os
-            os.makedirs("reports", exist_ok=True)
+            filepath = self.reports_dir / filename
 
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(f"周度报告: {week_start.strftime('%Y-%m-%d')} 至 {datetime.now().strftime('%Y-%m-%d')}\n")
@@ -129,13 +152,9 @@ class PaperScheduler:
     def _save_trending_topics(self, topics: List[str]):
         """保存热门主题"""
         try:
-            from datetime import timedelta
             week_start = datetime.now() - timedelta(days=datetime.now().weekday())
             filename = f"trending_topics_{week_start.strftime('%Y%m%d')}.txt"
-            filepath = f"trends/{filename}"
-
-            import os
-            os.makedirs("trends", exist_ok=True)
+            filepath = self.trends_dir / filename
 
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(f"热门主题: {week_start.strftime('%Y-%m-%d')} 至 {datetime.now().strftime('%Y-%m-%d')}\n")
@@ -159,6 +178,10 @@ class PaperScheduler:
             schedule.every().monday.at("10:00").do(self.weekly_analysis_task)
             logger.info("已设置每周分析任务，执行时间: 每周一 10:00")
 
+            # 长时间运行时定期更新查询规划器的统计信息
+            schedule.every(15).minutes.do(self.scraper.db.optimize)
+            logger.info("已设置数据库优化任务，每15分钟执行一次")
+
         except Exception as e:
             logger.error(f"设置定时任务失败: {e}")
 
@@ -166,6 +189,7 @@ class PaperScheduler:
         """启动调度器"""
         try:
             self.is_running = True
+            self._wakeup.clear()
             logger.info("论文爬取调度器启动")
 
             # 设置定时任务
@@ -174,10 +198,11 @@ class PaperScheduler:
             # 立即执行一次任务（可选）
             # self.daily_scrape_task()
 
-            # 主循环
+            # 主循环：睡眠到下一个任务的执行时间（最长60秒），调用stop()时立即唤醒
             while self.is_running:
                 schedule.run_pending()
-                time.sleep(60)  # 每分钟检查一次
+                idle = schedule.idle_seconds()
+                self._wakeup.wait(60 if idle is None else min(max(idle, 0), 60))
 
         except KeyboardInterrupt:
             logger.info("接收到中断信号，正在停止调度器...")
@@ -189,12 +214,24 @@ class PaperScheduler:
     def stop(self):
         """停止调度器"""
         self.is_running = False
+        self._wakeup.set()
+        # 不再接受新的后台分析，正在进行的分析在后台线程中继续完成
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        # 释放主循环线程持有的数据库长连接
+        self.scraper.db.close()
+        self.analyzer.db.close()
         logger.info("论文爬取调度器已停止")
 
     def run_once(self):
         """手动运行一次爬取任务"""
         logger.info("手动执行爬取任务")
-        return self.daily_scrape_task()
+        saved_count = self.daily_scrape_task()
+        # 手动运行时等待后台分析完成再返回
+        if self._analysis_future is not None:
+            self._analysis_future.result()
+        return saved_count
 
     def update_keywords(self, new_keywords: List[str]):
         """更新搜索关键词"""
@@ -1,27 +1,288 @@
+import atexit
 import requests
-import feedparser
-from datetime import datetime, timedelta
-from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from urllib.parse import quote
 import logging
 import sys
 import re
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import closing
+from types import MappingProxyType, SimpleNamespace
 from pathlib import Path
 
 # 添加项目根目录到Python路径
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from lxml import etree
+
 from src.data.database import Paper, DatabaseManager
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# arXiv详情页中的提交日期，合并为一个正则单次扫描（直接匹配响应字节，省去整页解码）：
+# "Submitted on [day] [month] [year]"、"Submitted [day] [month] [year]"、"[day] [month] [year] (Submitted"
+_SUBMITTED_DATE_RE = re.compile(
+    rb'Submitted(?:\s+on)?\s+(\d{1,2})\s+(\w+)\s+(\d{4})'
+    rb'|(\d{1,2})\s+(\w+)\s+(\d{4})\s*\(Submitted',
+    re.IGNORECASE
+)
+
+# 找不到提交日期时备选的日期格式，按命名分组区分
+_FALLBACK_DATE_RE = re.compile(
+    rb'(?P<iso>\d{4}-\d{2}-\d{2})'  # YYYY-MM-DD
+    rb'|(?P<us>\d{1,2}/\d{1,2}/\d{4})'  # MM/DD/YYYY
+)
+
+# 流式读取详情页时每块的大小，以及续扫时回退的字节数（覆盖跨块的匹配）
+_PAGE_CHUNK_SIZE = 8192
+_PAGE_SCAN_OVERLAP = 256
+
+# 月份映射（只读）
+_MONTH_MAP = MappingProxyType({
+    'january': 1, 'jan': 1,
+    'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'may': 5,
+    'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9, 'sept': 9,
+    'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'december': 12, 'dec': 12
+})
+
+# arXiv API返回的Atom feed命名空间
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+# Python 3.11起fromisoformat直接支持'Z'后缀，无需额外的字符串替换
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _parse_arxiv_feed(source) -> List[SimpleNamespace]:
+    """
+    用lxml增量解析arXiv API返回的Atom feed，边下载边解析，已处理的条目及时释放
+
+    Args:
+        source: 可读的文件对象（如流式响应的 response.raw）
+
+    Returns:
+        条目列表，字段与feedparser的条目一致（id、title、summary、authors、tags、published、updated、link）
+    """
+    entries = []
+    # 不解析外部实体、不访问网络，并保留libxml2默认的文档深度和节点大小限制（防御异常的超大响应）
+    for _, node in etree.iterparse(source, tag=f'{_ATOM_NS}entry', resolve_entities=False,
+                                   no_network=True, load_dtd=False, huge_tree=False):
+        authors = [
+            SimpleNamespace(name=author.findtext(f'{_ATOM_NS}name', ''))
+            for author in node.iterfind(f'{_ATOM_NS}author')
+        ]
+        link = ''
+        for link_node in node.iterfind(f'{_ATOM_NS}link'):
+            if link_node.get('rel', 'alternate') == 'alternate':
+                link = link_node.get('href', '')
+                break
+        entry = SimpleNamespace(
+            id=node.findtext(f'{_ATOM_NS}id', ''),
+            title=node.findtext(f'{_ATOM_NS}title', '').strip(),
+            summary=node.findtext(f'{_ATOM_NS}summary', '').strip(),
+            authors=authors,
+            tags=[SimpleNamespace(term=tag.get('term')) for tag in node.iterfind(f'{_ATOM_NS}category')],
+            link=link
+        )
+        for field in ('published', 'updated'):
+            value = node.findtext(f'{_ATOM_NS}{field}')
+            if value is not None:
+                setattr(entry, field, value)
+        entries.append(entry)
+        # 释放已解析的条目，避免整棵树常驻内存
+        node.clear()
+        while node.getprevious() is not None:
+            del node.getparent()[0]
+    return entries
+
+
+def _fromisoformat(value: str) -> datetime:
+    """用标准库解析ISO 8601时间，Python 3.11之前需先把'Z'后缀换成'+00:00'"""
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# 安装了ciso8601时用其C实现解析时间（原生支持'Z'后缀），否则使用标准库
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = _fromisoformat
+
+
+def _parse_atom_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    解析Atom feed中的日期字段（如 2024-12-31T18:00:00Z）
+
+    Args:
+        value: published或updated字段的文本
+
+    Returns:
+        UTC时间（不带时区，与数据库中的时间一致），缺失或无法解析时返回None
+    """
+    if not value:
+        return None
+    try:
+        parsed = _parse_iso_datetime(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _date_from_arxiv_id(arxiv_id: str) -> Optional[datetime]:
+    """
+    从新格式arXiv ID（YYMM.NNNNN）解析年月，日期取当月1日
+
+    Args:
+        arxiv_id: arXiv论文ID
+
+    Returns:
+        解析出的日期，旧格式ID（如 cond-mat/0101001）或无法解析时返回None
+    """
+    # arXiv ID格式: YYMM.xxxxxx 或 YYMM.Nxxxxx
+    date_part = arxiv_id.split('.')[0]
+    if len(date_part) == 4 and date_part.isdigit():
+        month = int(date_part[2:4])
+        if 1 <= month <= 12:
+            return datetime(2000 + int(date_part[:2]), month, 1)
+    return None
+
+
+# 详情页提交日期的进程内LRU缓存：arxiv_id -> 提交日期（只缓存成功获取的结果，失败的下次重试）
+# 提交日期在服务端不会变化，无需过期；Web端每个请求都会新建爬虫实例，因此放在模块级别共享
+_SUBMISSION_DATE_MEMO_MAX = 4096
+_submission_date_memo: "OrderedDict[str, datetime]" = OrderedDict()
+_submission_date_memo_lock = threading.Lock()
+
+# 并发获取arXiv详情页的最大线程数
+_PAGE_FETCH_WORKERS = max(1, settings.ARXIV_PAGE_FETCH_WORKERS)
+
+# 并发请求arXiv API分页结果的最大线程数（arXiv要求控制请求频率，不宜过大）
+_API_QUERY_WORKERS = 3
+
+# 已带搜索字段前缀的关键词（支持复杂查询语法）
+_FIELD_PREFIXES = ('all:', 'ti:', 'au:', 'cat:')
+
+
+def _build_query(keywords: List[str], start_date: datetime, end_date: datetime) -> str:
+    """
+    构建arXiv API的search_query：所有关键词AND连接，并限定提交时间范围
+
+    Args:
+        keywords: 搜索关键词列表
+        start_date: 搜索开始日期
+        end_date: 搜索结束日期
+
+    Returns:
+        完整的查询字符串
+    """
+    # 已经包含字段前缀的关键词直接使用，否则用all:字段在标题、摘要和作者中搜索
+    search_query = " AND ".join(
+        f'({keyword})' if keyword.startswith(_FIELD_PREFIXES) else f'all:"{keyword}"'
+        for keyword in keywords
+    )
+    return f'({search_query}) AND submittedDate:[{start_date:%Y%m%d%H%M%S} TO {end_date:%Y%m%d%H%M%S}]'
+
+
+def _build_params(query: str, start: int, max_results: int) -> Dict[str, object]:
+    """构建arXiv API请求参数，按提交日期降序排列，确保最新的在前"""
+    return {
+        'search_query': query,
+        'start': start,
+        'max_results': max_results,
+        'sortBy': 'submittedDate',
+        'sortOrder': 'descending'
+    }
+
+
+class _RequestPacer:
+    """请求节拍器：保证相邻两次请求的发出时间至少间隔min_interval秒，线程安全"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """阻塞到允许发出下一次请求；已经间隔足够久时立即返回"""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            # 先预约发出时间再等待，并发的请求按到达顺序依次排开
+            scheduled = max(now, self._next_time)
+            self._next_time = scheduled + self.min_interval
+        if scheduled > now:
+            time.sleep(scheduled - now)
+
+
+# 所有爬虫实例共享的arXiv API节拍器，按arXiv的使用规范相邻请求至少间隔ARXIV_API_MIN_INTERVAL秒
+_api_pacer = _RequestPacer(settings.ARXIV_API_MIN_INTERVAL)
+
+# 请求arXiv API时声明期望的Atom格式
+_ATOM_HEADERS = {'Accept': 'application/atom+xml'}
+
+# 浏览器请求头，模拟浏览器访问arXiv
+_BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def _create_http_session() -> requests.Session:
+    """
+    创建复用连接的HTTP会话，对限流和服务端错误自动退避重试
+
+    Returns:
+        配置好连接池和重试策略的会话
+    """
+    session = requests.Session()
+    session.headers.update(_BROWSER_HEADERS)
+    # Accept-Encoding沿用requests默认值（gzip, deflate），安装brotli后会自动加入br并负责解压
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                  allowed_methods=frozenset(['GET', 'HEAD']))
+    # 每个API分页线程内部还会并发获取详情页，单个主机的连接池需容纳两者相乘的线程数，
+    # 否则多出的连接用完即被丢弃，无法保持长连接
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_PAGE_FETCH_WORKERS * _API_QUERY_WORKERS,
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# 所有爬虫实例共享的HTTP会话（Web应用每个请求都会新建爬虫实例），保持与arXiv的长连接
+_http_session = _create_http_session()
+# 进程退出时关闭连接池中的长连接
+atexit.register(_http_session.close)
+
+
 class ArxivScraper:
-    def __init__(self, keyword: str = None):
+    def __init__(self, keyword: str = None, verify_date: bool = False, require_day_precision: Optional[bool] = None):
         self.base_url = "http://export.arxiv.org/api/query"
         self.arxiv_base_url = "https://arxiv.org/abs/"
         self.keyword = keyword
+        # 是否逐篇请求详情页核对提交日期；默认直接使用Atom的published字段，只在缺失时才请求详情页
+        self.verify_date = verify_date
+        # 是否需要精确到日的发表日期；为False时新格式ID直接按年月解析，不再请求详情页（未指定时使用配置）
+        if require_day_precision is None:
+            require_day_precision = settings.ARXIV_REQUIRE_DAY_PRECISION
+        self.require_day_precision = require_day_precision
         # 根据关键词获取数据库管理器
         if keyword:
             from src.data.keyword_manager import keyword_manager
@@ -30,13 +291,13 @@ class ArxivScraper:
         else:
             self.db = DatabaseManager(settings.database_path)
         # 设置请求头，模拟浏览器
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        self.headers = _BROWSER_HEADERS
+        # 复用共享会话的连接池
+        self.session = _http_session
 
     def get_submission_date_from_page(self, arxiv_id: str) -> Optional[datetime]:
         """
-        从arXiv详情页面获取准确的提交日期
+        从arXiv详情页面获取准确的提交日期（同一进程内重复查询直接返回缓存结果）
 
         Args:
             arxiv_id: arXiv论文ID
@@ -44,87 +305,121 @@ class ArxivScraper:
         Returns:
             提交日期datetime对象，如果获取失败返回None
         """
+        return self._lookup_submission_date(arxiv_id)[0]
+
+    def _lookup_submission_date(self, arxiv_id: str) -> Tuple[Optional[datetime], bool]:
+        """
+        查询详情页提交日期，先查进程内缓存
+
+        Args:
+            arxiv_id: arXiv论文ID
+
+        Returns:
+            (提交日期, 页面是否访问成功)；页面正常但找不到日期时为 (None, True)，请求或解析失败时为 (None, False)
+        """
+        with _submission_date_memo_lock:
+            submission_date = _submission_date_memo.get(arxiv_id)
+            if submission_date is not None:
+                _submission_date_memo.move_to_end(arxiv_id)
+                return submission_date, True
+
         try:
-            url = f"{self.arxiv_base_url}{arxiv_id}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            submission_date = self._fetch_submission_date(arxiv_id)
+        except requests.RequestException as e:
+            logger.error(f"请求arXiv页面失败 {arxiv_id}: {e}")
+            return None, False
+        except Exception as e:
+            logger.error(f"解析arXiv页面时出错 {arxiv_id}: {e}")
+            return None, False
+
+        if submission_date is not None:
+            with _submission_date_memo_lock:
+                _submission_date_memo[arxiv_id] = submission_date
+                while len(_submission_date_memo) > _SUBMISSION_DATE_MEMO_MAX:
+                    _submission_date_memo.popitem(last=False)
+        return submission_date, True
+
+    def _fetch_submission_date(self, arxiv_id: str) -> Optional[datetime]:
+        """请求arXiv详情页并解析提交日期，页面上找不到日期时返回None，请求失败时抛出异常"""
+        url = f"{self.arxiv_base_url}{arxiv_id}"
+        # 流式读取页面，"Submitted on"通常出现在页面前部，找到后即停止扫描
+        with self.session.get(url, timeout=10, stream=True) as response:
             response.raise_for_status()
-
-            # 使用正则表达式查找 "Submitted on" 日期
-            # 匹配模式：Submitted on [day] [month] [year]
-            patterns = [
-                r'Submitted on (\d{1,2})\s+(\w+)\s+(\d{4})',
-                r'Submitted\s+(\d{1,2})\s+(\w+)\s+(\d{4})',
-                r'(\d{1,2})\s+(\w+)\s+(\d{4})\s*\(Submitted',
-            ]
-
-            for pattern in patterns:
-                matches = re.findall(pattern, response.text, re.IGNORECASE)
-                if matches:
-                    day, month_str, year = matches[0]
-
-                    # 月份映射
-                    month_map = {
-                        'january': 1, 'jan': 1,
-                        'february': 2, 'feb': 2,
-                        'march': 3, 'mar': 3,
-                        'april': 4, 'apr': 4,
-                        'may': 5,
-                        'june': 6, 'jun': 6,
-                        'july': 7, 'jul': 7,
-                        'august': 8, 'aug': 8,
-                        'september': 9, 'sep': 9, 'sept': 9,
-                        'october': 10, 'oct': 10,
-                        'november': 11, 'nov': 11,
-                        'december': 12, 'dec': 12
-                    }
-
-                    month = month_map.get(month_str.lower())
+            page = bytearray()
+            scan_pos = 0
+            for chunk in response.iter_content(chunk_size=_PAGE_CHUNK_SIZE):
+                page += chunk
+                # 使用正则表达式查找 "Submitted on" 日期，只扫描新到达的数据
+                for match in _SUBMITTED_DATE_RE.finditer(page, scan_pos):
+                    day, month_str, year = [group for group in match.groups() if group is not None]
+
+                    month = _MONTH_MAP.get(month_str.decode('ascii').lower())
                     if month:
                         submission_date = datetime(int(year), month, int(day))
                         logger.info(f"从arXiv页面获取提交日期: {arxiv_id} -> {submission_date.strftime('%Y-%m-%d')}")
+                        # 丢弃剩余内容而不是断开连接，让连接回到连接池继续复用
+                        for _ in response.iter_content(chunk_size=_PAGE_CHUNK_SIZE):
+                            pass
                         return submission_date
                     else:
-                        logger.warning(f"无法解析月份: {month_str}")
-
-            # 如果正则表达式没找到，尝试查找其他日期模式
-            # 查找页面中的任何日期信息作为备选
-            date_patterns = [
-                r'(\d{4}-\d{2}-\d{2})',  # YYYY-MM-DD
-                r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-            ]
-
-            for pattern in date_patterns:
-                matches = re.findall(pattern, response.text)
-                if matches:
-                    # 取第一个匹配的日期
-                    date_str = matches[0]
-                    if '-' in date_str:  # YYYY-MM-DD格式
-                        try:
-                            submission_date = datetime.strptime(date_str, '%Y-%m-%d')
-                            logger.info(f"从arXiv页面获取日期(备选): {arxiv_id} -> {submission_date.strftime('%Y-%m-%d')}")
-                            return submission_date
-                        except ValueError:
-                            continue
-                    elif '/' in date_str:  # MM/DD/YYYY格式
-                        try:
-                            month, day, year = date_str.split('/')
-                            submission_date = datetime(int(year), int(month), int(day))
-                            logger.info(f"从arXiv页面获取日期(备选): {arxiv_id} -> {submission_date.strftime('%Y-%m-%d')}")
-                            return submission_date
-                        except ValueError:
-                            continue
-
-            logger.warning(f"无法从arXiv页面找到提交日期: {arxiv_id}")
-            return None
+                        logger.warning(f"无法解析月份: {month_str.decode('ascii', 'replace')}")
+                    scan_pos = match.end()
+                scan_pos = max(scan_pos, len(page) - _PAGE_SCAN_OVERLAP)
 
-        except requests.RequestException as e:
-            logger.error(f"请求arXiv页面失败 {arxiv_id}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"解析arXiv页面时出错 {arxiv_id}: {e}")
-            return None
+        # 如果正则表达式没找到，尝试查找其他日期模式
+        # 取页面中第一个有效的日期作为备选
+        for match in _FALLBACK_DATE_RE.finditer(page):
+            try:
+                if match.lastgroup == 'iso':  # YYYY-MM-DD格式
+                    submission_date = datetime.strptime(match.group('iso').decode('ascii'), '%Y-%m-%d')
+                else:  # MM/DD/YYYY格式
+                    month, day, year = match.group('us').split(b'/')
+                    submission_date = datetime(int(year), int(month), int(day))
+            except ValueError:
+                continue
+            logger.info(f"从arXiv页面获取日期(备选): {arxiv_id} -> {submission_date.strftime('%Y-%m-%d')}")
+            return submission_date
+
+        logger.warning(f"无法从arXiv页面找到提交日期: {arxiv_id}")
+        return None
+
+    def _ids_needing_page_date(self, entries: List[SimpleNamespace]) -> List[str]:
+        """返回需要从详情页获取提交日期的条目ID：核对模式下为全部条目，否则只包括缺少published字段的条目"""
+        return [entry.id.split('/')[-1] for entry in entries
+                if self.verify_date or _parse_atom_date(getattr(entry, 'published', None)) is None]
+
+    def fetch_submission_dates(self, arxiv_ids: List[str]) -> Dict[str, Optional[datetime]]:
+        """
+        获取多篇论文的提交日期：先查数据库缓存，未命中的并发请求详情页
 
-    def search_papers(self, keywords: List[str], max_results: int = 10, days_back: int = 7) -> List[Paper]:
+        Args:
+            arxiv_ids: arXiv论文ID列表
+
+        Returns:
+            {arxiv_id: 提交日期} 字典，获取失败的为None
+        """
+        if not self.require_day_precision and not self.verify_date:
+            # 只需要月份精度时，新格式ID本身已包含年月，只为旧格式ID请求详情页
+            arxiv_ids = [arxiv_id for arxiv_id in arxiv_ids if _date_from_arxiv_id(arxiv_id) is None]
+        if not arxiv_ids:
+            return {}
+
+        dates: Dict[str, Optional[datetime]] = dict(self.db.get_cached_submission_dates(arxiv_ids))
+        missing_ids = [arxiv_id for arxiv_id in dict.fromkeys(arxiv_ids) if arxiv_id not in dates]
+        if dates:
+            logger.info(f"命中提交日期缓存{len(dates)}篇，需请求详情页{len(missing_ids)}篇")
+
+        if missing_ids:
+            with ThreadPoolExecutor(max_workers=min(len(missing_ids), _PAGE_FETCH_WORKERS)) as executor:
+                fetched = dict(zip(missing_ids, executor.map(self._lookup_submission_date, missing_ids)))
+            # 缓存成功获取的日期，以及页面正常但确实没有日期的ID（之后不再请求）；请求失败的下次重试
+            self.db.save_submission_dates({arxiv_id: date for arxiv_id, (date, page_ok) in fetched.items() if page_ok})
+            dates.update((arxiv_id, date) for arxiv_id, (date, _) in fetched.items())
+
+        return dates
+
+    def search_papers(self, keywords: List[str], max_results: int = 10, days_back: int = 7,
+                      skip_existing: bool = False) -> List[Paper]:
         """
         根据关键词搜索arXiv论文
 
@@ -132,24 +427,11 @@ class ArxivScraper:
             keywords: 搜索关键词列表
             max_results: 最大结果数
             days_back: 回溯天数
+            skip_existing: 是否跳过数据库中已存在的论文（跳过的论文不获取日期也不解析）
 
         Returns:
-            论文列表
+            论文列表，skip_existing为True时只包含数据库中尚未保存的论文
         """
-        # 构建搜索查询
-        query_parts = []
-        for keyword in keywords:
-            # 检查关键词是否已经包含搜索字段前缀（如 all:, ti:, au: 等）
-            if any(keyword.startswith(prefix) for prefix in ['all:', 'ti:', 'au:', 'cat:']):
-                # 如果已经包含字段前缀，直接使用（支持复杂查询语法）
-                query_parts.append(f'({keyword})')
-            else:
-                # 使用all:字段在标题、摘要和作者中搜索
-                query_parts.append(f'all:"{keyword}"')
-
-        # 使用AND关系，要求论文同时包含所有关键词
-        search_query = " AND ".join(query_parts)
-
         # 根据需要调整时间范围和搜索策略
         if max_results > 30:
             # 对于大量请求，扩大时间范围并分批搜索
@@ -161,27 +443,33 @@ class ArxivScraper:
         start_date = end_date - timedelta(days=days_back)
 
         # 构建完整的查询
-        full_query = f'({search_query}) AND submittedDate:[{start_date.strftime("%Y%m%d%H%M%S")} TO {end_date.strftime("%Y%m%d%H%M%S")}]'
-
-        params = {
-            'search_query': full_query,
-            'start': 0,
-            'max_results': max_results,
-            'sortBy': 'submittedDate',
-            'sortOrder': 'descending'
-        }
+        full_query = _build_query(keywords, start_date, end_date)
+        params = _build_params(full_query, 0, max_results)
 
         try:
             logger.info(f"搜索查询: {full_query}")
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-
-            # 解析Atom feed
-            feed = feedparser.parse(response.content)
+            _api_pacer.wait()
+            # 流式读取响应，直接交给增量解析器，不再整体缓存响应体
+            with self.session.get(self.base_url, params=params, headers=_ATOM_HEADERS,
+                                  timeout=30, stream=True) as response:
+                response.raise_for_status()
+                logger.debug(f"arXiv API响应编码: {response.headers.get('Content-Encoding', 'identity')}")
+                response.raw.decode_content = True
+                entries = _parse_arxiv_feed(response.raw)
+
+            if skip_existing:
+                # 一次查询跳过数据库中已有的论文，不再为它们获取日期和解析
+                existing_ids = self.db.get_existing_arxiv_ids([entry.id.split('/')[-1] for entry in entries])
+                if existing_ids:
+                    entries = [entry for entry in entries if entry.id.split('/')[-1] not in existing_ids]
+                    logger.info(f"跳过数据库中已存在的论文 {len(existing_ids)} 篇")
+
+            # 只为需要的条目（默认为缺少published字段的条目）并发获取详情页日期，再逐条解析
+            page_dates = self.fetch_submission_dates(self._ids_needing_page_date(entries))
 
             papers = []
-            for entry in feed.entries:
-                paper = self._parse_entry(entry)
+            for entry in entries:
+                paper = self._parse_entry(entry, page_dates)
                 if paper:
                     papers.append(paper)
 
@@ -195,8 +483,17 @@ class ArxivScraper:
             logger.error(f"解析arXiv响应失败: {e}")
             return []
 
-    def _parse_entry(self, entry) -> Optional[Paper]:
-        """解析arXiv条目"""
+    def _parse_entry(self, entry, page_dates: Optional[Dict[str, Optional[datetime]]] = None) -> Optional[Paper]:
+        """
+        解析arXiv条目
+
+        Args:
+            entry: _parse_arxiv_feed解析出的条目
+            page_dates: 预先获取的详情页提交日期（仅在条目缺少published字段时使用），为None时按需请求详情页
+
+        Returns:
+            论文对象，解析失败时返回None
+        """
         try:
             # 提取作者信息
             authors = []
@@ -211,82 +508,39 @@ class ArxivScraper:
             # 提取arXiv ID
             arxiv_id = entry.id.split('/')[-1]
 
-            # 提取发布日期 - 优先从arXiv详情页面获取准确的提交日期
-            published_date = None
+            # 提取发布日期 - Atom的published字段即v1的提交时间，默认直接使用
+            api_date = _parse_atom_date(getattr(entry, 'published', None))
+            published_date = None if self.verify_date else api_date
 
-            # 方法1: 从arXiv详情页面获取准确的提交日期（最准确）
-            try:
-                page_date = self.get_submission_date_from_page(arxiv_id)
-                if page_date:
-                    published_date = page_date
-                    logger.info(f"从arXiv页面获取准确提交日期: {arxiv_id} -> {published_date.strftime('%Y-%m-%d')}")
-            except Exception as e:
-                logger.warning(f"从arXiv页面获取日期失败 {arxiv_id}: {e}")
-
-            # 方法2: 如果页面获取失败，尝试从arXiv ID解析年月信息
+            # 方法2: 只需要月份精度时，直接从arXiv ID解析年月，不请求详情页
+            if published_date is None and not self.require_day_precision and not self.verify_date:
+                published_date = _date_from_arxiv_id(arxiv_id)
+
+            # 方法3: 需要核对日期或API没有给出提交时间时，从arXiv详情页面获取
             if published_date is None:
                 try:
-                    # arXiv ID格式: YYMM.xxxxxx 或 YYMM.Nxxxxx
-                    arxiv_parts = arxiv_id.split('.')
-                    if len(arxiv_parts) > 0:
-                        date_part = arxiv_parts[0]
-                        if len(date_part) == 4 and date_part.isdigit():
-                            year = 2000 + int(date_part[:2])
-                            month = int(date_part[2:4])
-                            published_date = datetime(year, month, 1)
-                            logger.info(f"从arXiv ID解析发表日期: {arxiv_id} -> {published_date.strftime('%Y-%m-%d')}")
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"无法从arXiv ID解析日期 {arxiv_id}: {e}")
-
-            # 方法3: 如果上述方法都失败，尝试从API字段获取
+                    if page_dates is not None:
+                        published_date = page_dates.get(arxiv_id)
+                    else:
+                        published_date = self.fetch_submission_dates([arxiv_id]).get(arxiv_id)
+                    if published_date:
+                        logger.info(f"从arXiv页面获取准确提交日期: {arxiv_id} -> {published_date.strftime('%Y-%m-%d')}")
+                except Exception as e:
+                    logger.warning(f"从arXiv页面获取日期失败 {arxiv_id}: {e}")
+                # 核对失败时退回API给出的提交时间
+                published_date = published_date or api_date
+
+            # 方法4: 如果页面获取失败，尝试从arXiv ID解析年月信息
             if published_date is None:
-                logger.warning(f"无法获取准确日期，尝试从API字段获取日期: {arxiv_id}")
-
-                # 检查是否有更详细的发布信息
-                if hasattr(entry, 'published'):
-                    try:
-                        if isinstance(entry.published, str):
-                            # 处理带时区的日期字符串
-                            if 'T' in entry.published:
-                                api_date = datetime.fromisoformat(entry.published.replace('Z', '+00:00'))
-                            else:
-                                # 处理简化的日期格式
-                                api_date = datetime.strptime(entry.published, '%Y-%m-%d')
-                        else:
-                            api_date = entry.published
-
-                        # 检查API日期是否合理（不应该太接近当前时间）
-                        now = datetime.now()
-                        if (now - api_date).days > 1:  # 如果API日期至少比当前时间早1天
-                            published_date = api_date
-                            logger.info(f"使用API发布日期: {arxiv_id} -> {published_date.strftime('%Y-%m-%d')}")
-                        else:
-                            logger.warning(f"API发布日期过于接近当前时间，可能不准确: {api_date}")
-                    except (ValueError, AttributeError) as e:
-                        logger.warning(f"无法解析发布日期 {entry.published}: {e}")
-
-                # 如果published字段不可用，尝试updated字段
-                if published_date is None and hasattr(entry, 'updated'):
-                    try:
-                        if isinstance(entry.updated, str):
-                            # 处理带时区的日期字符串
-                            if 'T' in entry.updated:
-                                api_date = datetime.fromisoformat(entry.updated.replace('Z', '+00:00'))
-                            else:
-                                # 处理简化的日期格式
-                                api_date = datetime.strptime(entry.updated, '%Y-%m-%d')
-                        else:
-                            api_date = entry.updated
-
-                        # 检查API日期是否合理
-                        now = datetime.now()
-                        if (now - api_date).days > 1:
-                            published_date = api_date
-                            logger.info(f"使用API更新日期: {arxiv_id} -> {published_date.strftime('%Y-%m-%d')}")
-                        else:
-                            logger.warning(f"API更新日期过于接近当前时间，可能不准确: {api_date}")
-                    except (ValueError, AttributeError) as e:
-                        logger.warning(f"无法解析更新日期 {entry.updated}: {e}")
+                published_date = _date_from_arxiv_id(arxiv_id)
+                if published_date:
+                    logger.info(f"从arXiv ID解析发表日期: {arxiv_id} -> {published_date.strftime('%Y-%m-%d')}")
+
+            # 方法5: 如果上述方法都失败，使用最近一次更新的时间
+            if published_date is None:
+                published_date = _parse_atom_date(getattr(entry, 'updated', None))
+                if published_date:
+                    logger.info(f"使用API更新日期: {arxiv_id} -> {published_date.strftime('%Y-%m-%d')}")
 
             # 最后的备选方案：使用当前时间（但这应该很少发生）
             if published_date is None:
@@ -342,15 +596,10 @@ class ArxivScraper:
         else:
             search_limit = max_papers
 
-        papers = self.search_papers(keywords, search_limit)
-        saved_count = 0
-
-        for paper in papers:
-            if self.db.save_paper(paper):
-                saved_count += 1
-                logger.info(f"保存论文: {paper.title} (ID: {paper.arxiv_id})")
-            else:
-                logger.debug(f"论文已存在，跳过: {paper.arxiv_id}")
+        # 只解析数据库中还没有的论文，保存时再由 INSERT OR IGNORE 兜底跳过重复项
+        papers = self.search_papers(keywords, search_limit, skip_existing=True)
+        # 单个事务批量写入
+        saved_count = self.db.save_papers_bulk(papers)
 
         logger.info(f"成功保存 {saved_count} 篇论文")
         return saved_count
@@ -358,14 +607,7 @@ class ArxivScraper:
     def _get_today_papers_count(self) -> int:
         """获取今天已保存的论文数量"""
         try:
-            import sqlite3
-            with sqlite3.connect(self.db.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT COUNT(*) FROM papers
-                    WHERE DATE(created_at) = DATE('now')
-                """)
-                return cursor.fetchone()[0] or 0
+            return self.db.count_papers_created_today()
         except Exception as e:
             logger.error(f"获取今日论文数量失败: {e}")
             return 0
@@ -388,8 +630,6 @@ class ArxivScraper:
             latest_paper_date = self.db.get_latest_paper_date()
             if latest_paper_date:
                 # 增量爬取应该搜索比最新论文更早的论文
-                from datetime import timedelta
-
                 # 计算搜索的起始日期（最新论文的前一天）
                 search_end_date = latest_paper_date - timedelta(days=1)
 
@@ -410,14 +650,12 @@ class ArxivScraper:
                 logger.info(f"增量爬取：搜索范围 {search_start_date.date()} 到 {search_end_date.date()}（最新论文：{latest_paper_date.date()}）")
             else:
                 # 数据库为空，搜索最近的论文
-                from datetime import timedelta
                 search_end_date = datetime.now()
                 search_start_date = search_end_date - timedelta(days=7)
                 days_back = 7
                 logger.info("数据库为空，搜索最近7天的论文")
         except Exception as e:
             logger.warning(f"获取最新论文日期失败：{e}，使用默认策略")
-            from datetime import timedelta
             search_end_date = datetime.now()
             search_start_date = search_end_date - timedelta(days=7)
             days_back = 7
@@ -434,6 +672,7 @@ class ArxivScraper:
 
         # 实现多轮搜索，自动扩展时间范围
         all_papers = []
+        seen_ids = set()
         current_search_start_date = search_start_date
         current_search_end_date = search_end_date
         max_expansion_rounds = 5  # 最多扩展5轮时间范围
@@ -442,21 +681,27 @@ class ArxivScraper:
         for round_num in range(max_expansion_rounds):
             logger.info(f"=== 第 {round_num + 1} 轮搜索：{current_search_start_date.date()} 到 {current_search_end_date.date()} ===")
 
-            # 使用连续搜索在这个时间范围内搜索
-            round_papers = self._search_in_time_range(
+            # 使用连续搜索在这个时间范围内逐批搜索，每批到达后立即去重，找够新论文就不再请求后续批次
+            round_count = 0
+            new_papers = []
+            with closing(self._iter_time_range_batches(
                 keywords=keywords,
                 start_date=current_search_start_date,
                 end_date=current_search_end_date,
                 search_limit=search_limit
-            )
-
-            # 过滤掉已存在的论文
-            new_papers = []
-            for paper in round_papers:
-                if not self.db.paper_exists(paper.arxiv_id):
-                    new_papers.append(paper)
-
-            logger.info(f"第 {round_num + 1} 轮找到 {len(new_papers)} 篇新论文（总共搜索到 {len(round_papers)} 篇）")
+            )) as batches:
+                for batch_papers in batches:
+                    round_count += len(batch_papers)
+                    # 过滤掉已存在的论文（一次查询检查本批全部论文）以及之前批次已收集的论文
+                    existing_ids = self.db.get_existing_arxiv_ids([paper.arxiv_id for paper in batch_papers])
+                    for paper in batch_papers:
+                        if paper.arxiv_id not in existing_ids and paper.arxiv_id not in seen_ids:
+                            seen_ids.add(paper.arxiv_id)
+                            new_papers.append(paper)
+                    if len(all_papers) + len(new_papers) >= additional_count:
+                        break
+
+            logger.info(f"第 {round_num + 1} 轮找到 {len(new_papers)} 篇新论文（总共搜索到 {round_count} 篇）")
 
             all_papers.extend(new_papers)
 
@@ -479,25 +724,19 @@ class ArxivScraper:
                 logger.info(f"第 {round_num + 1} 轮找到 {len(new_papers)} 篇新论文，总共 {len(all_papers)} 篇")
 
         logger.info(f"搜索完成，总共找到 {len(all_papers)} 篇新候选论文")
-        saved_count = 0
-
-        for paper in all_papers:
-            if self.db.save_paper(paper):
-                saved_count += 1
-                logger.info(f"保存论文: {paper.title} (ID: {paper.arxiv_id})")
-
-                # 达到目标数量就停止
-                if saved_count >= additional_count:
-                    break
-            else:
-                logger.debug(f"论文已存在，跳过: {paper.arxiv_id}")
+        # 候选论文已按数据库和ID去重，截取目标数量后批量写入
+        saved_count = self.db.save_papers_bulk(all_papers[:additional_count])
 
         logger.info(f"增量爬取完成，成功保存 {saved_count} 篇论文")
         return saved_count
 
-    def _search_in_time_range(self, keywords: List[str], start_date: datetime, end_date: datetime, search_limit: int) -> List[Paper]:
+    def _iter_time_range_batches(self, keywords: List[str], start_date: datetime, end_date: datetime,
+                                 search_limit: int) -> Iterator[List[Paper]]:
         """
-        在指定时间范围内进行连续搜索
+        在指定时间范围内分批连续搜索，按批次顺序逐批产出结果
+
+        各分页批次相互独立，最多同时请求 _API_QUERY_WORKERS 批；调用方提前停止迭代（关闭生成器）时，
+        尚未开始的批次会被取消，不再请求
 
         Args:
             keywords: 搜索关键词列表
@@ -506,22 +745,23 @@ class ArxivScraper:
             search_limit: 搜索限制数量
 
         Returns:
-            找到的论文列表
+            每批找到的论文列表的迭代器，遇到空批次或不满的批次（已到达搜索结果末尾）时结束
         """
-        all_papers = []
         batch_size = 30  # arXiv API单次最多返回30篇
 
         # 计算需要多少批次
         num_batches = (search_limit + batch_size - 1) // batch_size
+        if num_batches <= 0:
+            return
 
-        for batch in range(num_batches):
+        def fetch_batch(batch: int) -> List[Paper]:
             start_index = batch * batch_size
             batch_limit = min(batch_size, search_limit - start_index)
 
             logger.debug(f"执行第 {batch + 1}/{num_batches} 批连续搜索，从索引 {start_index} 开始，获取 {batch_limit} 篇")
 
             # 使用连续搜索
-            batch_papers = self.search_papers_continuous_with_range(
+            return self.search_papers_continuous_with_range(
                 keywords=keywords,
                 max_results=batch_limit,
                 start_index=start_index,
@@ -529,23 +769,31 @@ class ArxivScraper:
                 end_date=end_date
             )
 
-            if not batch_papers:
-                logger.debug("本批次没有找到论文，停止本轮搜索")
-                break
-
-            all_papers.extend(batch_papers)
-
-            # 如果本批次找到的论文少于请求数量，可能已经到了搜索结果的末尾
-            if len(batch_papers) < batch_limit:
-                logger.debug(f"本批次返回论文数量 ({len(batch_papers)}) 少于请求数量 ({batch_limit})，已到达搜索结果末尾")
-                break
-
-            # 避免请求过于频繁
-            import time
-            time.sleep(1)
-
-        logger.debug(f"时间范围 {start_date.date()} 到 {end_date.date()} 搜索完成，找到 {len(all_papers)} 篇论文")
-        return all_papers
+        executor = ThreadPoolExecutor(max_workers=min(_API_QUERY_WORKERS, num_batches))
+        pending = deque()
+        next_batch = 0
+        try:
+            for batch in range(num_batches):
+                # 保持至多 _API_QUERY_WORKERS 个批次在请求中，按需提交后续批次
+                while next_batch < num_batches and len(pending) < _API_QUERY_WORKERS:
+                    pending.append(executor.submit(fetch_batch, next_batch))
+                    next_batch += 1
+
+                batch_papers = pending.popleft().result()
+                if not batch_papers:
+                    logger.debug(f"第 {batch + 1} 批没有找到论文，已到达搜索结果末尾")
+                    return
+                yield batch_papers
+
+                # 如果本批次找到的论文少于请求数量，已经到了搜索结果的末尾，预取的后续批次随之取消
+                batch_limit = min(batch_size, search_limit - batch * batch_size)
+                if len(batch_papers) < batch_limit:
+                    logger.debug(f"本批次返回论文数量 ({len(batch_papers)}) 少于请求数量 ({batch_limit})，已到达搜索结果末尾")
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def search_papers_continuous_with_range(self, keywords: List[str], max_results: int = 30,
                                          start_index: int = 0, start_date: datetime = None,
@@ -563,48 +811,33 @@ class ArxivScraper:
         Returns:
             论文列表
         """
-        # 构建搜索查询
-        query_parts = []
-        for keyword in keywords:
-            # 检查关键词是否已经包含搜索字段前缀（如 all:, ti:, au: 等）
-            if any(keyword.startswith(prefix) for prefix in ['all:', 'ti:', 'au:', 'cat:']):
-                # 如果已经包含字段前缀，直接使用（支持复杂查询语法）
-                query_parts.append(f'({keyword})')
-            else:
-                # 使用all:字段在标题、摘要和作者中搜索
-                query_parts.append(f'all:"{keyword}"')
-
-        # 使用AND关系，要求论文同时包含所有关键词
-        search_query = " AND ".join(query_parts)
-
         # 使用自定义时间范围
         if end_date is None:
             end_date = datetime.now()
         if start_date is None:
             start_date = end_date - timedelta(days=30)
 
-        # 构建完整的查询
-        full_query = f'({search_query}) AND submittedDate:[{start_date.strftime("%Y%m%d%H%M%S")} TO {end_date.strftime("%Y%m%d%H%M%S")}]'
-
-        params = {
-            'search_query': full_query,
-            'start': start_index,  # 关键：使用start参数实现连续搜索
-            'max_results': max_results,
-            'sortBy': 'submittedDate',
-            'sortOrder': 'descending'  # 按提交日期降序排列，确保最新的在前
-        }
+        # 构建完整的查询，使用start参数实现连续搜索
+        full_query = _build_query(keywords, start_date, end_date)
+        params = _build_params(full_query, start_index, max_results)
 
         logger.debug(f"连续搜索查询: {full_query}")
         logger.debug(f"搜索参数: start={start_index}, max_results={max_results}")
 
         try:
-            response = requests.get(self.base_url, params=params, headers=self.headers, timeout=30)
-            response.raise_for_status()
-
-            feed = feedparser.parse(response.content)
+            _api_pacer.wait()
+            with self.session.get(self.base_url, params=params, headers=_ATOM_HEADERS,
+                                  timeout=30, stream=True) as response:
+                response.raise_for_status()
+                logger.debug(f"arXiv API响应编码: {response.headers.get('Content-Encoding', 'identity')}")
+                response.raw.decode_content = True
+                entries = _parse_arxiv_feed(response.raw)
             papers = []
 
-            for entry in feed.entries:
+            # 只为需要的条目（默认为缺少published字段的条目）并发获取详情页日期
+            page_dates = self.fetch_submission_dates(self._ids_needing_page_date(entries))
+
+            for entry in entries:
                 try:
                     # 提取作者信息
                     authors = []
@@ -620,17 +853,17 @@ class ArxivScraper:
 
                     # 从arXiv ID中提取准确的提交日期
                     arxiv_id = entry.id.split('/')[-1]
-                    published_date = self.get_submission_date_from_page(arxiv_id)
-
-                    # 如果无法从页面获取日期，使用entry中的日期作为备用
+                    # published字段即v1的提交时间，缺失时再用详情页日期；核对模式下优先使用详情页日期
+                    api_date = _parse_atom_date(getattr(entry, 'published', None))
+                    page_date = page_dates.get(arxiv_id)
+                    published_date = (page_date or api_date) if self.verify_date else (api_date or page_date)
+                    if not published_date and not self.require_day_precision:
+                        published_date = _date_from_arxiv_id(arxiv_id)
+
+                    # 如果仍无法确定日期，使用更新时间或当前时间作为备用
                     if not published_date:
-                        if hasattr(entry, 'published'):
-                            published_date = entry.published
-                        elif hasattr(entry, 'updated'):
-                            published_date = entry.updated
-                        else:
-                            published_date = datetime.now()
-                        logger.warning(f"无法从页面获取日期，使用备用日期: {arxiv_id} -> {published_date}")
+                        published_date = _parse_atom_date(getattr(entry, 'updated', None)) or datetime.now()
+                        logger.warning(f"无法获取提交日期，使用备用日期: {arxiv_id} -> {published_date}")
 
                     paper = Paper(
                         title=entry.title,
@@ -656,32 +889,3 @@ class ArxivScraper:
         except Exception as e:
             logger.error(f"连续搜索失败: {e}")
             return []
-
-    def get_trending_topics(self, days: int = 7) -> List[str]:
-        """
-        获取最近的热门主题（基于出现频率最高的关键词）
-
-        Args:
-            days: 分析的天数
-
-        Returns:
-            热门主题列表
-        """
-        papers = self.db.get_recent_papers(days)
-
-        # 简单的关键词提取（可以后续改进为更复杂的NLP方法）
-        from collections import Counter
-        import re
-
-        all_words = []
-        for paper in papers:
-            # 从标题和摘要中提取单词
-            text = f"{paper.title} {paper.abstract}".lower()
-            words = re.findall(r'\b\w+\b', text)
-            # 过滤掉常见词汇
-            words = [word for word in words if len(word) > 3 and word not in
-                     ['this', 'that', 'with', 'from', 'they', 'have', 'been', 'will', 'are', 'our', 'can']]
-            all_words.extend(words)
-
-        word_freq = Counter(all_words)
-        return [word for word, _ in word_freq.most_common(10)]
\ No newline at end of file
@@ -1,12 +1,35 @@
 import sqlite3
 import hashlib
 import logging
-from datetime import datetime
-from typing import List, Optional
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# 数据哈希的进程内短期缓存：(数据库路径, 天数) -> (计算时间, 哈希值)
+# Web端每个请求都可能新建数据库管理器，因此放在模块级别共享
+_DATA_HASH_TTL = 5.0
+_data_hash_memo: Dict[Tuple[str, int], Tuple[float, str]] = {}
+_data_hash_lock = threading.Lock()
+
+# IN查询每批的参数个数，低于旧版SQLite单条语句999个参数的上限
+_IN_QUERY_BATCH_SIZE = 500
+
+
+def _configure_connection(conn: sqlite3.Connection):
+    """设置连接级PRAGMA（WAL模式本身在建表时已持久化到数据库文件）"""
+    # WAL模式下NORMAL即可保证一致性，减少每次提交的fsync
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # 写锁被占用时最多等待30秒，而不是立即报database is locked
+    conn.execute("PRAGMA busy_timeout=30000")
+    # 临时表和排序使用内存，页缓存扩大到64MB
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+
 @dataclass
 class Paper:
     title: str
@@ -23,11 +46,61 @@ class DatabaseManager:
     def __init__(self, db_path: str = "arxiv_papers.db", keyword: str = "default"):
         self.keyword = keyword
         self.db_path = db_path
+        # 每个线程复用一个数据库连接，连接上缓存预编译语句
+        self._local = threading.local()
         self.init_database()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """获取当前线程的数据库连接（首次访问时创建）"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            _configure_connection(conn)
+            self._local.conn = conn
+        return conn
+
+    @property
+    def ro_conn(self) -> sqlite3.Connection:
+        """获取当前线程的只读数据库连接，用于纯查询（首次访问时创建）"""
+        conn = getattr(self._local, 'ro_conn', None)
+        if conn is None:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            _configure_connection(conn)
+            self._local.ro_conn = conn
+        return conn
+
+    def close(self):
+        """关闭当前线程持有的数据库长连接"""
+        for name in ('conn', 'ro_conn'):
+            conn = getattr(self._local, name, None)
+            if conn is not None:
+                conn.close()
+                setattr(self._local, name, None)
+
+    def connect(self) -> sqlite3.Connection:
+        """新建一个已完成PRAGMA设置的数据库连接"""
+        conn = sqlite3.connect(self.db_path)
+        _configure_connection(conn)
+        return conn
+
+    def optimize(self):
+        """执行PRAGMA optimize，让SQLite按需更新统计信息以改进查询计划"""
+        try:
+            with self.connect() as conn:
+                conn.execute("PRAGMA optimize")
+        except Exception as e:
+            logger.error(f"数据库优化失败: {e}")
+
     def init_database(self):
         """初始化数据库表"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connect() as conn:
+            # WAL模式下读写互不阻塞
+            conn.execute("PRAGMA journal_mode=WAL")
+
             # 创建论文表
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS papers (
@@ -44,6 +117,11 @@ class DatabaseManager:
                 )
             """)
 
+            # 按发表时间查询最近论文时使用的索引
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_published ON papers(published_date)")
+            # 按入库时间统计当日新增论文时使用的索引
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_created_at ON papers(created_at)")
+
             # 创建洞察缓存表
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS insights_cache (
@@ -56,40 +134,141 @@ class DatabaseManager:
                     updated_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+
+            # 创建摘要缓存表，以(模型, 标题, 摘要)的哈希为键
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS summary_cache (
+                    hash BLOB PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    created_at INTEGER NOT NULL
+                )
+            """)
+
+            # 创建洞察生成进度表，流式生成过程中保存已收到的内容
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS insights_progress (
+                    cache_key TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 创建通用LLM响应缓存表，以(模型, 消息, 参数)的哈希为键
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    prompt_hash TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 创建arXiv提交日期缓存表，提交日期不会变化，无需过期
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS arxiv_date_cache (
+                    arxiv_id TEXT PRIMARY KEY,
+                    submission_date TEXT NOT NULL
+                )
+            """)
             conn.commit()
 
     def paper_exists(self, arxiv_id: str) -> bool:
         """检查论文是否已存在"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.ro_conn as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT 1 FROM papers WHERE arxiv_id = ?", (arxiv_id,))
             return cursor.fetchone() is not None
 
+    def get_existing_arxiv_ids(self, arxiv_ids: List[str]) -> set:
+        """
+        用一次IN查询找出已在数据库中的arXiv ID
+
+        Args:
+            arxiv_ids: 待检查的arXiv ID列表
+
+        Returns:
+            已存在的arXiv ID集合
+        """
+        unique_ids = list(dict.fromkeys(arxiv_ids))
+        existing = set()
+
+        for start in range(0, len(unique_ids), _IN_QUERY_BATCH_SIZE):
+            batch = unique_ids[start:start + _IN_QUERY_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor = self.ro_conn.execute(
+                f"SELECT arxiv_id FROM papers WHERE arxiv_id IN ({placeholders})",
+                batch
+            )
+            existing.update(row['arxiv_id'] for row in cursor)
+        return existing
+
+    def count_papers_created_between(self, start: datetime, end: datetime) -> int:
+        """
+        统计入库时间在 [start, end) 区间内的论文数量
+
+        Args:
+            start: 起始时间（UTC，与 CURRENT_TIMESTAMP 一致）
+            end: 结束时间（UTC，不含）
+
+        Returns:
+            论文数量
+        """
+        # created_at 以 'YYYY-MM-DD HH:MM:SS' 文本存储，区间比较可以直接走索引
+        row = self.ro_conn.execute(
+            "SELECT COUNT(*) FROM papers WHERE created_at >= ? AND created_at < ?",
+            (start.strftime('%Y-%m-%d %H:%M:%S'), end.strftime('%Y-%m-%d %H:%M:%S'))
+        ).fetchone()
+        return row[0] or 0
+
+    def count_papers_created_today(self) -> int:
+        """统计今天（UTC，与 CURRENT_TIMESTAMP 一致）入库的论文数量"""
+        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.count_papers_created_between(today_start, today_start + timedelta(days=1))
+
     def save_paper(self, paper: Paper) -> bool:
-        """保存论文到数据库"""
-        if self.paper_exists(paper.arxiv_id):
-            return False
+        """保存论文到数据库，已存在时跳过（由 INSERT OR IGNORE 判断，无需先查询一次）"""
+        return self.save_papers_bulk([paper]) > 0
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO papers (title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary)
+    def save_papers_bulk(self, papers: List[Paper]) -> int:
+        """
+        在单个事务中批量保存论文，已存在的论文自动跳过
+
+        Args:
+            papers: 待保存的论文列表
+
+        Returns:
+            实际新增的论文数量
+        """
+        if not papers:
+            return 0
+
+        rows = [(
+            paper.title,
+            ','.join(paper.authors),
+            paper.abstract,
+            paper.arxiv_id,
+            paper.published_date.isoformat(),
+            ','.join(paper.categories),
+            paper.pdf_url,
+            paper.summary
+        ) for paper in papers]
+
+        with self.conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO papers (title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                paper.title,
-                ','.join(paper.authors),
-                paper.abstract,
-                paper.arxiv_id,
-                paper.published_date.isoformat(),
-                ','.join(paper.categories),
-                paper.pdf_url,
-                paper.summary
-            ))
-            conn.commit()
-        return True
+            """, rows)
+            saved_count = conn.total_changes - before
+        if saved_count:
+            self.invalidate_data_hash()
+        return saved_count
 
     def get_recent_papers(self, days: int = 7) -> List[Paper]:
         """获取最近几天的论文"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.ro_conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary, created_at
@@ -113,9 +292,72 @@ class DatabaseManager:
                 ))
             return papers
 
+    def get_recent_papers_by_windows(self, windows: List[int]) -> Dict[int, List[Paper]]:
+        """
+        一次查询获取多个时间范围内的最近论文，结果与分别调用get_recent_papers一致
+
+        Args:
+            windows: 天数列表
+
+        Returns:
+            {天数: 论文列表} 字典
+        """
+        if not windows:
+            return {}
+
+        conn = self.ro_conn
+        # 由SQLite计算各时间范围的起点，与get_recent_papers的过滤条件保持一致
+        thresholds = {
+            days: conn.execute("SELECT datetime('now', ?)", (f'-{days} days',)).fetchone()[0]
+            for days in windows
+        }
+        cursor = conn.execute("""
+            SELECT title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary, created_at
+            FROM papers
+            WHERE published_date >= ?
+            ORDER BY published_date DESC
+        """, (min(thresholds.values()),))
+
+        rows = [
+            (row['published_date'], Paper(
+                title=row['title'],
+                authors=row['authors'].split(','),
+                abstract=row['abstract'],
+                arxiv_id=row['arxiv_id'],
+                published_date=datetime.fromisoformat(row['published_date']),
+                categories=row['categories'].split(','),
+                pdf_url=row['pdf_url'],
+                summary=row['summary'],
+                created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
+            ))
+            for row in cursor
+        ]
+        return {
+            days: [paper for published, paper in rows if published >= threshold]
+            for days, threshold in thresholds.items()
+        }
+
+    def iter_recent_text(self, days: int = 7) -> Iterator[Tuple[str, str]]:
+        """
+        逐行返回最近几天论文的标题和正文（有生成摘要时用摘要，否则用英文摘要）
+
+        Args:
+            days: 天数
+
+        Returns:
+            (标题, 正文) 元组迭代器
+        """
+        cursor = self.ro_conn.execute("""
+            SELECT title, COALESCE(NULLIF(summary, ''), abstract)
+            FROM papers
+            WHERE published_date >= datetime('now', ?)
+            ORDER BY published_date DESC
+        """, (f'-{days} days',))
+        yield from cursor
+
     def get_all_papers(self) -> List[Paper]:
         """获取所有论文（不限制时间范围）"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.ro_conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary, created_at
@@ -140,7 +382,7 @@ class DatabaseManager:
 
     def get_papers_without_summary(self, limit: int = None) -> List[Paper]:
         """获取没有摘要的论文"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.ro_conn as conn:
             cursor = conn.cursor()
 
             # 构建查询语句
@@ -179,7 +421,7 @@ class DatabaseManager:
         Returns:
             最新论文的发表日期，如果数据库为空返回None
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self.ro_conn as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT MAX(published_date) FROM papers")
             result = cursor.fetchone()
@@ -190,7 +432,7 @@ class DatabaseManager:
 
     def get_data_hash(self, days: int = 7) -> str:
         """
-        获取数据的哈希值，用于检测数据变化
+        获取数据的哈希值，用于检测数据变化（结果在进程内缓存数秒，写入论文时失效）
 
         Args:
             days: 分析的天数（基于论文发表时间）
@@ -198,9 +440,27 @@ class DatabaseManager:
         Returns:
             数据哈希字符串
         """
-        import hashlib
-
-        with sqlite3.connect(self.db_path) as conn:
+        key = (self.db_path, days)
+        now = time.monotonic()
+        with _data_hash_lock:
+            entry = _data_hash_memo.get(key)
+        if entry and now - entry[0] < _DATA_HASH_TTL:
+            return entry[1]
+
+        data_hash = self._compute_data_hash(days)
+        with _data_hash_lock:
+            _data_hash_memo[key] = (now, data_hash)
+        return data_hash
+
+    def invalidate_data_hash(self):
+        """清除当前数据库的数据哈希缓存，论文数据变化后调用"""
+        with _data_hash_lock:
+            for key in [k for k in _data_hash_memo if k[0] == self.db_path]:
+                del _data_hash_memo[key]
+
+    def _compute_data_hash(self, days: int) -> str:
+        """扫描论文表计算数据哈希"""
+        with self.ro_conn as conn:
             cursor = conn.cursor()
             # 使用论文发表时间而不是数据库创建时间，并排除可能变化的字段
             cursor.execute("""
@@ -239,7 +499,7 @@ class DatabaseManager:
             是否保存成功
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.conn as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS insights_cache (
@@ -280,7 +540,7 @@ class DatabaseManager:
             缓存数据字典，包含insights, trending, data_hash等
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.ro_conn as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT insights, trending, data_hash, created_at, updated_at
@@ -303,9 +563,243 @@ class DatabaseManager:
             logger.error(f"获取洞察缓存失败: {e}")
             return {}
 
+    def get_insights_cache_hash(self, cache_key: str) -> Optional[str]:
+        """
+        只获取洞察缓存对应的数据哈希
+        data_hash列位于洞察正文之前，只读该列时无需读取正文占用的溢出页
+
+        Args:
+            cache_key: 缓存键
+
+        Returns:
+            缓存的数据哈希，没有缓存时为None
+        """
+        try:
+            row = self.ro_conn.execute(
+                "SELECT data_hash FROM insights_cache WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            return row['data_hash'] if row else None
+        except Exception as e:
+            logger.error(f"获取洞察缓存哈希失败: {e}")
+            return None
+
+    def get_insights_cache_updated_at(self, cache_key: str) -> Optional[str]:
+        """
+        只获取洞察缓存的更新时间，供状态轮询使用
+
+        Args:
+            cache_key: 缓存键
+
+        Returns:
+            缓存的更新时间，没有缓存时为None
+        """
+        try:
+            row = self.ro_conn.execute(
+                "SELECT updated_at FROM insights_cache WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            return row['updated_at'] if row else None
+        except Exception as e:
+            logger.error(f"获取洞察缓存更新时间失败: {e}")
+            return None
+
+    def get_cached_submission_dates(self, arxiv_ids: List[str]) -> Dict[str, Optional[datetime]]:
+        """
+        批量查询已缓存的arXiv提交日期
+
+        Args:
+            arxiv_ids: arXiv ID列表
+
+        Returns:
+            命中的 {arxiv_id: 提交日期} 字典，已确认详情页上没有日期的为None
+        """
+        unique_ids = list(dict.fromkeys(arxiv_ids))
+        if not unique_ids:
+            return {}
+
+        try:
+            cached = {}
+            # 分批查询，避免超出SQLite单条语句的参数数量上限
+            for start in range(0, len(unique_ids), _IN_QUERY_BATCH_SIZE):
+                batch = unique_ids[start:start + _IN_QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor = self.ro_conn.execute(
+                    f"SELECT arxiv_id, submission_date FROM arxiv_date_cache WHERE arxiv_id IN ({placeholders})",
+                    batch
+                )
+                # 空字符串表示详情页上找不到日期
+                cached.update(
+                    (row['arxiv_id'], datetime.fromisoformat(row['submission_date']) if row['submission_date'] else None)
+                    for row in cursor
+                )
+            return cached
+        except Exception as e:
+            logger.error(f"查询提交日期缓存失败: {e}")
+            return {}
+
+    def save_submission_dates(self, dates: Dict[str, Optional[datetime]]) -> bool:
+        """
+        批量写入arXiv提交日期缓存
+
+        Args:
+            dates: {arxiv_id: 提交日期} 字典，为None表示详情页上找不到日期（记为空字符串，之后不再请求）
+
+        Returns:
+            是否保存成功
+        """
+        if not dates:
+            return True
+
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO arxiv_date_cache (arxiv_id, submission_date) VALUES (?, ?)",
+                    [(arxiv_id, date.isoformat() if date else '') for arxiv_id, date in dates.items()]
+                )
+            return True
+        except Exception as e:
+            logger.error(f"保存提交日期缓存失败: {e}")
+            return False
+
+    def get_cached_summaries(self, hashes: List[bytes]) -> Dict[bytes, str]:
+        """
+        批量查询摘要缓存
+
+        Args:
+            hashes: 缓存键列表
+
+        Returns:
+            命中的 {缓存键: 摘要} 字典
+        """
+        if not hashes:
+            return {}
+
+        try:
+            cached = {}
+            # 分批查询，避免超出SQLite单条语句的参数数量上限
+            for start in range(0, len(hashes), _IN_QUERY_BATCH_SIZE):
+                batch = hashes[start:start + _IN_QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor = self.conn.execute(
+                    f"SELECT hash, summary FROM summary_cache WHERE hash IN ({placeholders})",
+                    batch
+                )
+                cached.update((bytes(row[0]), row[1]) for row in cursor.fetchall())
+            return cached
+        except Exception as e:
+            logger.error(f"查询摘要缓存失败: {e}")
+            return {}
+
+    def save_cached_summaries(self, rows: List[Tuple[bytes, str, str]]) -> bool:
+        """
+        批量写入摘要缓存
+
+        Args:
+            rows: (缓存键, 模型名称, 摘要) 元组列表
+
+        Returns:
+            是否保存成功
+        """
+        if not rows:
+            return True
+
+        try:
+            now = int(datetime.now().timestamp())
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO summary_cache (hash, model, summary, created_at) VALUES (?, ?, ?, ?)",
+                    [(h, model, summary, now) for h, model, summary in rows]
+                )
+            return True
+        except Exception as e:
+            logger.error(f"保存摘要缓存失败: {e}")
+            return False
+
+    def save_insights_progress(self, cache_key: str, content: str) -> bool:
+        """
+        保存洞察生成进度（已收到的部分内容）
+
+        Args:
+            cache_key: 洞察缓存键
+            content: 当前已生成的内容
+
+        Returns:
+            是否保存成功
+        """
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO insights_progress (cache_key, content, updated_at) VALUES (?, ?, datetime('now'))",
+                    (cache_key, content)
+                )
+            return True
+        except Exception as e:
+            logger.error(f"保存洞察生成进度失败: {e}")
+            return False
+
+    def get_insights_progress(self, cache_key: str) -> Optional[str]:
+        """获取正在生成的洞察的部分内容，没有进行中的生成时返回None"""
+        try:
+            row = self.conn.execute(
+                "SELECT content FROM insights_progress WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            logger.error(f"获取洞察生成进度失败: {e}")
+            return None
+
+    def clear_insights_progress(self, cache_key: str):
+        """清除洞察生成进度"""
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM insights_progress WHERE cache_key = ?", (cache_key,))
+        except Exception as e:
+            logger.error(f"清除洞察生成进度失败: {e}")
+
+    def get_llm_cache(self, prompt_hash: str) -> Optional[str]:
+        """
+        查询LLM响应缓存
+
+        Args:
+            prompt_hash: 请求内容的哈希值
+
+        Returns:
+            缓存的响应文本，未命中时为None
+        """
+        try:
+            row = self.conn.execute(
+                "SELECT response FROM llm_cache WHERE prompt_hash = ?", (prompt_hash,)
+            ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            logger.error(f"查询LLM响应缓存失败: {e}")
+            return None
+
+    def save_llm_cache(self, prompt_hash: str, model: str, response: str) -> bool:
+        """
+        保存LLM响应缓存
+
+        Args:
+            prompt_hash: 请求内容的哈希值
+            model: 模型名称
+            response: 响应文本
+
+        Returns:
+            是否保存成功
+        """
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (prompt_hash, model, response) VALUES (?, ?, ?)",
+                    (prompt_hash, model, response)
+                )
+            return True
+        except Exception as e:
+            logger.error(f"保存LLM响应缓存失败: {e}")
+            return False
+
     def search_papers(self, keyword: str) -> List[Paper]:
         """搜索包含关键词的论文"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.ro_conn as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary, created_at
@@ -329,59 +823,55 @@ class DatabaseManager:
                 ))
             return papers
 
-    def get_all_papers(self) -> List[Paper]:
-        """获取所有论文"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary, created_at
-                FROM papers
-                ORDER BY published_date DESC
-            """)
+    def get_papers_by_arxiv_ids(self, arxiv_ids: List[str]) -> Dict[str, dict]:
+        """
+        用一次IN查询批量获取论文的标题、英文摘要和中文摘要
 
-            papers = []
-            for row in cursor.fetchall():
-                papers.append(Paper(
-                    title=row[0],
-                    authors=row[1].split(','),
-                    abstract=row[2],
-                    arxiv_id=row[3],
-                    published_date=datetime.fromisoformat(row[4]),
-                    categories=row[5].split(','),
-                    pdf_url=row[6],
-                    summary=row[7],
-                    created_at=datetime.fromisoformat(row[8]) if row[8] else None
-                ))
-            return papers
+        Args:
+            arxiv_ids: arXiv ID列表
+
+        Returns:
+            {arxiv_id: {'title', 'abstract', 'summary'}} 字典，不存在的ID不包含在内
+        """
+        unique_ids = list(dict.fromkeys(arxiv_ids))
+        if not unique_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(unique_ids))
+        cursor = self.ro_conn.execute(
+            f"SELECT arxiv_id, title, abstract, summary FROM papers WHERE arxiv_id IN ({placeholders})",
+            unique_ids
+        )
+        return {
+            row['arxiv_id']: {'title': row['title'], 'abstract': row['abstract'], 'summary': row['summary']}
+            for row in cursor.fetchall()
+        }
 
     def get_paper_by_arxiv_id(self, arxiv_id: str) -> Optional[Paper]:
         """根据arxiv_id获取论文"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary, created_at
-                FROM papers
-                WHERE arxiv_id = ?
-            """, (arxiv_id,))
-
-            row = cursor.fetchone()
-            if row:
-                return Paper(
-                    title=row[0],
-                    authors=row[1].split(','),
-                    abstract=row[2],
-                    arxiv_id=row[3],
-                    published_date=datetime.fromisoformat(row[4]),
-                    categories=row[5].split(','),
-                    pdf_url=row[6],
-                    summary=row[7],
-                    created_at=datetime.fromisoformat(row[8]) if row[8] else None
-                )
-            return None
+        row = self.ro_conn.execute("""
+            SELECT title, authors, abstract, arxiv_id, published_date, categories, pdf_url, summary, created_at
+            FROM papers
+            WHERE arxiv_id = ?
+        """, (arxiv_id,)).fetchone()
+
+        if row:
+            return Paper(
+                title=row['title'],
+                authors=row['authors'].split(','),
+                abstract=row['abstract'],
+                arxiv_id=row['arxiv_id'],
+                published_date=datetime.fromisoformat(row['published_date']),
+                categories=row['categories'].split(','),
+                pdf_url=row['pdf_url'],
+                summary=row['summary'],
+                created_at=datetime.fromisoformat(row['created_at']) if row['created_at'] else None
+            )
+        return None
 
     def get_total_papers_count(self) -> int:
         """获取数据库中论文总数"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.ro_conn as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM papers")
             count = cursor.fetchone()[0]
@@ -40,22 +40,23 @@ class KeywordManager:
 
     def load_keywords(self):
         """加载关键词配置"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for name, config_data in data.items():
-                        self._keywords[name] = KeywordConfig(
-                            name=config_data['name'],
-                            display_name=config_data['display_name'],
-                            db_path=config_data['db_path'],
-                            search_query=config_data['search_query'],
-                            created_at=datetime.fromisoformat(config_data['created_at']),
-                            last_used=datetime.fromisoformat(config_data['last_used']),
-                            paper_count=config_data.get('paper_count', 0)
-                        )
-            except Exception as e:
-                logger.error(f"加载关键词配置失败: {e}")
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                for name, config_data in data.items():
+                    self._keywords[name] = KeywordConfig(
+                        name=config_data['name'],
+                        display_name=config_data['display_name'],
+                        db_path=config_data['db_path'],
+                        search_query=config_data['search_query'],
+                        created_at=datetime.fromisoformat(config_data['created_at']),
+                        last_used=datetime.fromisoformat(config_data['last_used']),
+                        paper_count=config_data.get('paper_count', 0)
+                    )
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"加载关键词配置失败: {e}")
 
         # 如果没有关键词，创建默认配置
         if not self._keywords:
@@ -99,14 +100,13 @@ class KeywordManager:
 
     def load_current_keyword(self):
         """加载当前关键词"""
-        if self.current_keyword_file.exists():
-            try:
-                with open(self.current_keyword_file, 'r', encoding='utf-8') as f:
-                    self._current_keyword = f.read().strip()
-            except Exception as e:
-                logger.error(f"加载当前关键词失败: {e}")
-                self._current_keyword = "default"
-        else:
+        try:
+            with open(self.current_keyword_file, 'r', encoding='utf-8') as f:
+                self._current_keyword = f.read().strip()
+        except FileNotFoundError:
+            self._current_keyword = "default"
+        except Exception as e:
+            logger.error(f"加载当前关键词失败: {e}")
             self._current_keyword = "default"
 
     def set_current_keyword(self, keyword: str) -> bool:
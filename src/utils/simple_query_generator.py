@@ -9,6 +9,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by _clean_keyword
+_WHITESPACE_RE = re.compile(r'\s+')
+_DISALLOWED_CHARS_RE = re.compile(r'[^\w\s\-\.,\'"()]')
+
 class SimpleQueryGenerator:
     """Simple query generator for user-defined keywords"""
 
@@ -85,10 +89,10 @@ class SimpleQueryGenerator:
     def _clean_keyword(self, keyword: str) -> str:
         """Clean individual keyword"""
         # Remove extra spaces
-        cleaned = re.sub(r'\s+', ' ', keyword.strip())
+        cleaned = _WHITESPACE_RE.sub(' ', keyword.strip())
 
         # Keep only alphanumeric and common characters
-        cleaned = re.sub(r'[^\w\s\-\.,\'"()]', ' ', cleaned)
+        cleaned = _DISALLOWED_CHARS_RE.sub(' ', cleaned)
 
         return cleaned
 
@@ -20,14 +20,13 @@ class ConfigManager:
 
     def _load_config(self) -> Dict[str, Any]:
         """加载配置文件"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"加载配置文件失败: {e}")
-                return self._get_default_config()
-        else:
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return self._get_default_config()
+        except Exception as e:
+            logger.error(f"加载配置文件失败: {e}")
             return self._get_default_config()
 
     def _get_default_config(self) -> Dict[str, Any]:
@@ -4,7 +4,10 @@
 """
 
 import os
+import re
 import sys
+import threading
+import traceback
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
 import json
 import markdown
@@ -31,14 +34,16 @@ static_folder = PROJECT_ROOT / "web" / "static"
 app = Flask(__name__, template_folder=str(template_folder), static_folder=str(static_folder))
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'arxiv-scraper-secret-key-change-in-production')
 
+# nl2br过滤器使用的换行符模式，模块加载时编译一次
+_NEWLINE_RE = re.compile(r'\r?\n')
+
 # 添加自定义过滤器
 @app.template_filter('nl2br')
 def nl2br_filter(text):
     """将换行符转换为HTML的<br>标签"""
     if text is None:
         return ''
-    import re
-    return re.sub(r'\r?\n', '<br>', text)
+    return _NEWLINE_RE.sub('<br>', text)
 
 # 初始化组件
 scheduler = PaperScheduler()
@@ -91,10 +96,10 @@ def refresh_insights():
 
     try:
         # 清除数据库缓存
-        import sqlite3
-        with sqlite3.connect(scraper.db.db_path) as conn:
+        with scraper.db.connect() as conn:
             conn.execute("DELETE FROM insights_cache WHERE cache_key = ?", (f'insights_{days}',))
             conn.commit()
+        analyzer.clear_insights_memo(days)
         logger.info(f"已清除 {days} 天的数据库洞察缓存")
 
         flash(f'正在重新生成 {days} 天洞察...', 'info')
@@ -487,9 +492,6 @@ def scrape_more():
                 def background_ai_analysis():
                     try:
                         # 在后台线程中重新初始化组件
-                        from src.core.scraper import ArxivScraper
-                        from src.core.analyzer import DeepSeekAnalyzer
-
                         # 使用当前关键词初始化scraper和analyzer，确保数据库路径正确
                         scraper = ArxivScraper(keyword=current_keyword)
                         analyzer = DeepSeekAnalyzer(keyword=current_keyword)
@@ -500,50 +502,29 @@ def scrape_more():
                         logger.info(f"  Analyzer: {analyzer.db.db_path}")
                         logger.info(f"  Config: {current_config.db_path}")
 
-                        analyzed_count = 0
                         total_count = len(papers_to_process)
 
                         logger.info(f"🔄 后台线程已启动，需要处理 {total_count} 篇论文")
 
-                        for i, paper in enumerate(papers_to_process):
-                            logger.info(f"正在生成论文摘要 ({i+1}/{total_count}): {paper.title[:50]}...")
-                            try:
-                                summary = analyzer.generate_summary(paper)
-                                if summary:
-                                    analyzer._update_paper_summary(paper.arxiv_id, summary)
-                                    analyzed_count += 1
-                                    logger.info(f"✅ 完成第 {i+1}/{total_count} 篇论文摘要")
-                                else:
-                                    logger.warning(f"❌ 第 {i+1}/{total_count} 篇论文摘要生成失败")
-                            except Exception as paper_error:
-                                logger.error(f"❌ 第 {i+1}/{total_count} 篇论文处理异常: {paper_error}")
-
-                            # 更新进度
-                            background_tasks['ai_analysis_progress'] = i + 1
-
-                            # 添加延迟避免API限制
-                            import time
-                            time.sleep(1)
+                        def update_progress(done: int, total: int):
+                            background_tasks['ai_analysis_progress'] = done
+
+                        # 批量并发生成摘要，速率由分析器统一控制，结果在单个事务中写回
+                        analyzed = analyzer.analyze_papers_batch(papers_to_process, on_progress=update_progress)
+                        analyzed_count = len([p for p in analyzed if p.summary])
+                        background_tasks['ai_analysis_progress'] = total_count
 
                         logger.info(f"🎉 后台AI摘要生成完成，成功处理 {analyzed_count}/{total_count} 篇论文")
 
                         # 数据库更新后，自动更新洞察缓存
                         logger.info("数据库已更新，开始自动更新洞察缓存...")
 
-                        # 更新不同时间范围的洞察
+                        # 更新不同时间范围的洞察，交给后台洞察工作线程依次处理
                         for days in [1, 7, 30]:
-                            try:
-                                updated = global_analyzer.auto_update_insights_if_needed(days)
-                                if updated:
-                                    logger.info(f"成功更新 {days} 天洞察缓存")
-                                else:
-                                    logger.info(f"{days} 天洞察缓存已是最新，无需更新")
-                            except Exception as e:
-                                logger.error(f"更新 {days} 天洞察缓存失败: {e}")
+                            global_analyzer.schedule_insights_update(days)
 
                     except Exception as e:
                         logger.error(f"后台AI摘要生成失败: {e}")
-                        import traceback
                         logger.error(f"错误详情: {traceback.format_exc()}")
                     finally:
                         # 重置任务状态
@@ -551,7 +532,6 @@ def scrape_more():
                         logger.info("🔄 后台任务状态已重置")
 
                 # 启动后台线程
-                import threading
                 logger.info("🚀 准备启动后台线程...")
                 background_thread = threading.Thread(target=background_ai_analysis, daemon=True)
                 background_thread.start()
@@ -560,32 +540,10 @@ def scrape_more():
                 logger.info(f"🚀 已启动后台AI分析任务，处理 {paper_count} 篇论文")
                 flash(f'已启动后台AI分析，正在处理 {paper_count} 篇论文，请稍后查看结果', 'info')
 
-            # 自动更新洞察（异步后台执行）
+            # 自动更新洞察（由后台洞察工作线程执行，不阻塞当前请求）
             try:
-                import threading
-                import time
-
-                def auto_update_insights():
-                    """后台自动更新洞察"""
-                    logger.info("开始后台自动更新研究洞察...")
-                    try:
-                        # 等待一小段时间确保数据库操作完成
-                        time.sleep(2)
-
-                        # 生成新洞察
-                        insights_data = analyzer.get_research_insights(7)
-                        trending_data = analyzer.get_trending_topics(7)
-
-                        # 洞察已通过analyzer自动缓存到数据库
-                        logger.info("后台洞察更新完成")
-                    except Exception as e:
-                        logger.error(f"后台洞察更新失败: {e}")
-
-                # 启动后台线程
-                insights_thread = threading.Thread(target=auto_update_insights, daemon=True)
-                insights_thread.start()
-                logger.info("已启动后台洞察更新任务")
-
+                analyzer.schedule_insights_update(7)
+                logger.info("已提交后台洞察更新任务")
             except Exception as e:
                 logger.error(f"启动后台洞察更新失败: {e}")
 
@@ -610,13 +568,15 @@ def api_insights_status():
     days = int(request.args.get('days', 7))
     cache_key = f'insights_{days}'
 
-    cached_insights = analyzer.db.get_insights_cache(cache_key)
+    # 轮询接口只需要更新时间，不读取洞察正文
+    last_updated = analyzer.db.get_insights_cache_updated_at(cache_key)
 
     status = {
         'cache_key': cache_key,
-        'has_cache': cached_insights is not None,
-        'last_updated': cached_insights.get('updated_at') if cached_insights else None,
-        'is_generating': cache_key in analyzer._generating_insights
+        'has_cache': last_updated is not None,
+        'last_updated': last_updated,
+        'is_generating': analyzer.is_generating_insights(days),
+        'partial_insights': analyzer.db.get_insights_progress(cache_key)
     }
 
     return jsonify(status)
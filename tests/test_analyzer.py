@@ -0,0 +1,43 @@
+"""
+热门主题分词测试
+"""
+from src.core.analyzer import _count_topic_words
+
+
+def test_count_topic_words_keeps_hyphenated_english_terms():
+    texts = [
+        "Graph Neural Networks for crystal-structure prediction.",
+        "We present graph neural networks (GNNs) trained on 2024 crystal-structure data.",
+    ]
+    word_count = _count_topic_words(texts)
+
+    assert word_count["graph"] == 2
+    assert word_count["neural"] == 2
+    assert word_count["crystal-structure"] == 2
+    # 常见词和过短的词不参与统计
+    assert "present" not in word_count
+    assert "for" not in word_count
+
+
+def test_count_topic_words_ignores_chinese_summary():
+    texts = [
+        "Perovskite solar cells 本文提出了一种基于机器学习的钙钛矿材料筛选方法，显著提升了效率。",
+        "Perovskite stability 本文提出了一种基于密度泛函理论的高通量计算流程。",
+    ]
+    word_count = _count_topic_words(texts)
+
+    assert word_count["perovskite"] == 2
+    assert all(word.isascii() for word in word_count)
+    assert word_count.most_common(1)[0][0] == "perovskite"
+
+
+def test_count_topic_words_splits_on_fullwidth_punctuation():
+    texts = [
+        "本文研究了钙钛矿（perovskite）材料，perovskite 稳定性。",
+        "基于注意力机制，transformer模型；transformer—based方法",
+    ]
+    word_count = _count_topic_words(texts)
+
+    assert word_count["perovskite"] == 2
+    assert word_count["transformer"] == 1
+    assert all(word.isascii() for word in word_count)